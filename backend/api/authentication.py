@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+
+def get_token_cache():
+    return caches[getattr(settings, 'AUTH_TOKEN_CACHE_ALIAS', 'default')]
+
+
+def token_cache_key(key):
+    return f'auth-token:{key}'
+
+
+def invalidate_cached_tokens(*keys):
+    if keys:
+        get_token_cache().delete_many([token_cache_key(key) for key in keys])
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that keeps the token, its user and the user's profile
+    in Django's cache for AUTH_TOKEN_CACHE_TTL seconds, so repeated calls skip
+    the Token + User (+ Profile) lookup.
+
+    Entries are dropped when the token is deleted or the user / profile is
+    saved (password change, deactivation, ...); see the receivers in
+    api.models. With a per-process cache (locmem) other workers may serve a
+    stale entry for at most the TTL, so use a shared backend in production.
+    """
+    def authenticate_credentials(self, key):
+        cache = get_token_cache()
+        cache_key = token_cache_key(key)
+        token = cache.get(cache_key)
+
+        if token is None:
+            model = self.get_model()
+            try:
+                token = model.objects.select_related('user', 'user__profile').get(key=key)
+            except model.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_('Invalid token.'))
+            cache.set(cache_key, token, getattr(settings, 'AUTH_TOKEN_CACHE_TTL', 300))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (token.user, token)
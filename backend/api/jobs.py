@@ -0,0 +1,229 @@
+"""
+Database-backed background jobs.
+
+enqueue() inserts a Job row in the caller's transaction. `manage.py
+run_workers` runs Worker loops that claim due jobs with SELECT ... FOR UPDATE
+SKIP LOCKED, so any number of workers (threads or processes) can poll the
+same table without running a job twice. A failed job is retried with
+exponential backoff until it reaches max_attempts; a job whose worker died
+is claimed again once its lease (JOB_LEASE_SECONDS) expires.
+"""
+import logging
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Job, TeamMemberContact
+
+logger = logging.getLogger(__name__)
+
+HANDLERS = {}
+FAILURE_HANDLERS = {}
+
+
+def job_handler(kind, on_failure=None):
+    """
+    Register `func(worker, payload)` as the handler for jobs of `kind`, and
+    `on_failure(payload)` to run once such a job has used up its attempts.
+    """
+    def register(func):
+        HANDLERS[kind] = func
+        if on_failure is not None:
+            FAILURE_HANDLERS[kind] = on_failure
+        return func
+    return register
+
+
+def enqueue(kind, payload, run_after=None):
+    return Job.objects.create(
+        kind=kind,
+        payload=payload,
+        run_after=run_after or timezone.now(),
+        max_attempts=getattr(settings, 'JOB_MAX_ATTEMPTS', 5),
+    )
+
+
+def email_payload(subject, message, from_email, recipient_list):
+    return {
+        'subject': subject,
+        'message': message,
+        'from_email': from_email,
+        'recipient_list': list(recipient_list),
+    }
+
+
+def enqueue_email(subject, message, from_email, recipient_list):
+    return enqueue('send_email', email_payload(subject, message, from_email, recipient_list))
+
+
+def enqueue_emails(messages):
+    """Queue several emails (dicts of enqueue_email() arguments) with one INSERT."""
+    max_attempts = getattr(settings, 'JOB_MAX_ATTEMPTS', 5)
+    return Job.objects.bulk_create([
+        Job(kind='send_email', payload=email_payload(**message), max_attempts=max_attempts)
+        for message in messages
+    ])
+
+
+def enqueue_invitations(invitations):
+    """
+    Queue team invitations, (contact, enqueue_email() arguments) pairs, with
+    one INSERT. A contact whose invitation cannot be delivered is marked failed.
+    """
+    max_attempts = getattr(settings, 'JOB_MAX_ATTEMPTS', 5)
+    return Job.objects.bulk_create([
+        Job(
+            kind='send_invitation',
+            payload={**email_payload(**message), 'contact_id': str(contact.pk), 'token': str(contact.invitation_token)},
+            max_attempts=max_attempts,
+        )
+        for contact, message in invitations
+    ])
+
+
+def retry_delay(attempts):
+    """Exponential backoff (base * 2^(attempts - 1), capped) with +/-20% jitter."""
+    base = getattr(settings, 'JOB_RETRY_BASE_SECONDS', 30)
+    cap = getattr(settings, 'JOB_RETRY_MAX_SECONDS', 3600)
+    delay = min(base * 2 ** max(attempts - 1, 0), cap)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def claim_jobs(limit):
+    """Mark up to `limit` due jobs as running and return them, skipping rows other workers hold."""
+    now = timezone.now()
+    lease_expired = now - timedelta(seconds=getattr(settings, 'JOB_LEASE_SECONDS', 600))
+    with transaction.atomic():
+        jobs = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(Q(status='queued', run_after__lte=now) | Q(status='running', locked_at__lt=lease_expired))
+            .order_by('run_after')[:limit]
+        )
+        if jobs:
+            Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+                status='running', locked_at=now, attempts=F('attempts') + 1, updated_at=now,
+            )
+    for job in jobs:
+        job.status = 'running'
+        job.locked_at = now
+        job.attempts += 1
+    return jobs
+
+
+class Worker:
+    """
+    Claims and runs jobs in batches. One SMTP connection is opened lazily and
+    reused for every email until the queue runs dry (or a send fails).
+    """
+    def __init__(self, batch_size=None, poll_interval=None):
+        self.batch_size = batch_size or getattr(settings, 'JOB_BATCH_SIZE', 20)
+        self.poll_interval = poll_interval if poll_interval is not None else getattr(settings, 'JOB_POLL_INTERVAL', 2.0)
+        self._email_connection = None
+
+    @property
+    def email_connection(self):
+        if self._email_connection is None:
+            self._email_connection = get_connection()
+            self._email_connection.open()
+        return self._email_connection
+
+    def close_email_connection(self):
+        if self._email_connection is not None:
+            try:
+                self._email_connection.close()
+            except Exception:
+                logger.warning("Error closing email connection", exc_info=True)
+            self._email_connection = None
+
+    def run(self, stop_event, once=False):
+        """Process batches until `stop_event` is set, or until the queue is empty when `once`."""
+        try:
+            while not stop_event.is_set():
+                if self.run_once():
+                    continue
+                self.close_email_connection()
+                if once:
+                    return
+                stop_event.wait(self.poll_interval)
+                close_old_connections()
+        finally:
+            self.close_email_connection()
+
+    def run_in_thread(self, stop_event, once=False):
+        try:
+            self.run(stop_event, once)
+        finally:
+            connection.close()
+
+    def run_once(self):
+        """Run one batch of due jobs; returns how many were claimed."""
+        jobs = claim_jobs(self.batch_size)
+        for job in jobs:
+            self.run_job(job)
+        return len(jobs)
+
+    def run_job(self, job):
+        handler = HANDLERS.get(job.kind)
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for job kind {job.kind!r}")
+            handler(self, job.payload)
+        except Exception as exc:
+            self.record_failure(job, exc)
+        else:
+            job.status = 'done'
+            job.locked_at = None
+            job.last_error = ''
+            job.save(update_fields=['status', 'locked_at', 'last_error', 'updated_at'])
+
+    def record_failure(self, job, exc):
+        job.last_error = f"{type(exc).__name__}: {exc}"
+        job.locked_at = None
+        if job.attempts >= job.max_attempts:
+            job.status = 'failed'
+            logger.error("Job %s (%s) failed permanently: %s", job.pk, job.kind, job.last_error)
+            on_failure = FAILURE_HANDLERS.get(job.kind)
+            if on_failure is not None:
+                try:
+                    on_failure(job.payload)
+                except Exception:
+                    logger.exception("Failure handler of job %s (%s) raised", job.pk, job.kind)
+        else:
+            job.status = 'queued'
+            job.run_after = timezone.now() + retry_delay(job.attempts)
+            logger.warning("Job %s (%s) attempt %s failed, retrying: %s", job.pk, job.kind, job.attempts, job.last_error)
+        job.save(update_fields=['status', 'locked_at', 'last_error', 'run_after', 'updated_at'])
+
+
+@job_handler('send_email')
+def send_email(worker, payload):
+    message = EmailMessage(
+        subject=payload['subject'],
+        body=payload['message'],
+        from_email=payload['from_email'],
+        to=payload['recipient_list'],
+        connection=worker.email_connection,
+    )
+    try:
+        message.send()
+    except Exception:
+        # The SMTP session may be unusable; reconnect for the next message
+        worker.close_email_connection()
+        raise
+
+
+def invitation_failed(payload):
+    # Unless a newer invitation (with a new token) has been sent since
+    TeamMemberContact.objects.filter(pk=payload['contact_id'], invitation_token=payload['token']).update(
+        status='failed', updated_at=timezone.now(),
+    )
+
+
+@job_handler('send_invitation', on_failure=invitation_failed)
+def send_invitation(worker, payload):
+    send_email(worker, payload)
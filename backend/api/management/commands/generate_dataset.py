@@ -0,0 +1,218 @@
+import itertools
+import random
+import time
+from collections import defaultdict, namedtuple
+from datetime import date, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from api.models import (
+    Event, EventAssignment, EventChecklist, FileSubmission, Profile, Task, TeamAccess,
+    TeamMemberContact, UserPreference, WeddingProject, rebuild_studio_stats,
+)
+
+FIRST_NAMES = [
+    'Aisha', 'Arjun', 'Amani', 'Bella', 'Chen', 'Dev', 'Esther', 'Farah', 'Grace', 'Hiro',
+    'Imani', 'Jonah', 'Kavya', 'Leila', 'Mateo', 'Nadia', 'Omar', 'Priya', 'Rafael', 'Sana',
+    'Tariq', 'Uma', 'Vera', 'Wanjiru', 'Yusuf', 'Zara',
+]
+LOCATIONS = ['Nairobi', 'Mombasa', 'Diani', 'Lamu', 'Naivasha', 'Nanyuki', 'Kisumu', 'Malindi', 'Watamu']
+SERVICE_TYPES = ['Photo', 'Video', 'Photo + Video']
+EVENT_NAMES = ['Haldi', 'Mehendi', 'Sangeet', 'Ceremony', 'Reception', 'Pre-wedding shoot', 'Engagement party']
+TASK_TITLES = [
+    'Cull raw photos', 'Colour grade highlights', 'Edit teaser', 'Edit full film', 'Design album',
+    'Client album review', 'Deliver online gallery', 'Back up footage', 'Order prints', 'Sync audio',
+]
+CHECKLIST_ITEMS = [
+    ('Charge batteries', 'equipment'), ('Format cards', 'equipment'), ('Pack lenses', 'equipment'),
+    ('Confirm venue access', 'logistics'), ('Shot list review', 'planning'), ('Backup drives', 'equipment'),
+    ('Family group list', 'planning'), ('Drone permit', 'logistics'),
+]
+# (profile role, contact role, contact category) for generated team members
+MEMBER_ROLES = [
+    ('photographer', 'Photographer', 'crew'),
+    ('videographer', 'Videographer', 'crew'),
+    ('photographer', 'Drone Operator', 'crew'),
+    ('editor', 'Editor', 'post_production'),
+]
+
+Member = namedtuple('Member', ['user', 'name', 'role', 'category'])
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic multi-studio dataset (owners, team members, projects, events, tasks, "
+        "checklists, submissions and the team graph) with bulk inserts, for local load testing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--studios', type=int, default=10, help="Number of studio owners")
+        parser.add_argument('--projects-per-studio', type=int, default=20)
+        parser.add_argument('--members-per-studio', type=int, default=8, help="Team members (users + contacts) per studio")
+        parser.add_argument('--freelancers-per-studio', type=int, default=2, help="Members of other studios also on this team")
+        parser.add_argument('--events-per-project', type=int, default=4)
+        parser.add_argument('--tasks-per-project', type=int, default=10)
+        parser.add_argument('--checklists-per-event', type=int, default=5)
+        parser.add_argument('--submissions-per-event', type=int, default=3)
+        parser.add_argument('--prefix', default='studio', help="Username prefix of generated users")
+        parser.add_argument('--password', default='password123', help="Password of every generated user")
+        parser.add_argument('--seed', type=int, default=0, help="Random seed, for reproducible datasets")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows per INSERT")
+
+    def handle(self, *args, **options):
+        if options['studios'] < 1:
+            raise CommandError("--studios must be at least 1")
+        if User.objects.filter(username__startswith=f"{options['prefix']}1-").exists():
+            raise CommandError(f"Users prefixed {options['prefix']!r} already exist; pass another --prefix")
+
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.today = date.today()
+
+        start = time.perf_counter()
+        with transaction.atomic():
+            counts = self.generate(options)
+        elapsed = time.perf_counter() - start
+
+        summary = ', '.join(f"{count} {name}" for name, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Generated {summary} in {elapsed:.1f}s"))
+        self.stdout.write(f"Studio owners: {options['prefix']}1-owner ... {options['prefix']}{options['studios']}-owner")
+
+    def bulk_create(self, model, rows):
+        return model.objects.bulk_create(rows, batch_size=self.batch_size)
+
+    def name(self):
+        return f"{self.random.choice(FIRST_NAMES)} {self.random.choice(FIRST_NAMES)[0]}."
+
+    def generate(self, options):
+        rng = self.random
+        password = make_password(options['password'])
+        prefix = options['prefix']
+
+        # Users and profiles (bulk_create skips the post_save signals that would create profiles)
+        owners, teams, profiles = [], [], []
+        for s in range(1, options['studios'] + 1):
+            owner = User(username=f"{prefix}{s}-owner", email=f"{prefix}{s}-owner@example.com", password=password)
+            owners.append(owner)
+            profiles.append(Profile(
+                user=owner, full_name=self.name(), company_name=f"Studio {s}", role='admin',
+                plan_type=rng.choice(Profile.PLAN_CHOICES)[0],
+            ))
+            team = []
+            for m in range(1, options['members_per_studio'] + 1):
+                role, contact_role, category = MEMBER_ROLES[(m - 1) % len(MEMBER_ROLES)]
+                user = User(username=f"{prefix}{s}-m{m}", email=f"{prefix}{s}-m{m}@example.com", password=password)
+                member = Member(user, self.name(), contact_role, category)
+                profiles.append(Profile(user=user, full_name=member.name, role=role))
+                team.append(member)
+            teams.append(team)
+        users = owners + [member.user for team in teams for member in team]
+        self.bulk_create(User, users)
+        self.bulk_create(Profile, profiles)
+        self.bulk_create(UserPreference, [UserPreference(user=owner) for owner in owners])
+
+        # Team graph: each studio's own members plus freelancers borrowed from other studios
+        contacts, access = {}, []
+        for index, owner in enumerate(owners):
+            team = list(teams[index])
+            others = [member for other, other_team in enumerate(teams) if other != index for member in other_team]
+            team += rng.sample(others, min(options['freelancers_per_studio'], len(others)))
+            contacts[owner.pk] = [
+                TeamMemberContact(
+                    owner=owner, name=member.name, role=member.role, category=[member.category],
+                    email=member.user.email, status='joined', phone_number=f"+2547{rng.randrange(10**8):08d}",
+                )
+                for member in team
+            ]
+            access += [TeamAccess(member=member.user, owner=owner) for member in team]
+        self.bulk_create(TeamMemberContact, [contact for team in contacts.values() for contact in team])
+        self.bulk_create(TeamAccess, access)
+
+        # Projects, spread from six months ago to a year ahead
+        projects = []
+        for owner in owners:
+            for _ in range(options['projects_per_studio']):
+                event_date = self.today + timedelta(days=rng.randint(-180, 365))
+                status = 'completed' if event_date < self.today and rng.random() < 0.8 else rng.choices(
+                    ['active', 'cancelled'], weights=[95, 5])[0]
+                projects.append(WeddingProject(
+                    user=owner, couple_name=f"{rng.choice(FIRST_NAMES)} & {rng.choice(FIRST_NAMES)}",
+                    event_date=event_date, event_type=rng.choice(WeddingProject.EVENT_TYPE_CHOICES)[0],
+                    location=rng.choice(LOCATIONS), service_type=rng.choice(SERVICE_TYPES), status=status,
+                    progress_percentage=100 if status == 'completed' else rng.randrange(0, 100, 5),
+                ))
+        self.bulk_create(WeddingProject, projects)
+
+        events, assignments, tasks = [], [], []
+        for project in projects:
+            team = contacts[project.user_id]
+            for n in range(options['events_per_project']):
+                event_date = project.event_date + timedelta(days=n - options['events_per_project'] + 1)
+                event = Event(
+                    project=project, event_name=EVENT_NAMES[n % len(EVENT_NAMES)], event_date=event_date,
+                    status='completed' if event_date < self.today else 'upcoming', location=project.location,
+                )
+                for role in ('photographer', 'cinematographer', 'drone_operator'):
+                    crew = rng.sample(team, min(rng.randint(1, 2), len(team)))
+                    setattr(event, role, ', '.join(contact.name for contact in crew))
+                    assignments += [
+                        EventAssignment(event=event, role=role, member=contact, member_name=contact.name,
+                                        name_key=contact.name.lower())
+                        for contact in crew
+                    ]
+                events.append(event)
+            positions = defaultdict(itertools.count)
+            for _ in range(options['tasks_per_project']):
+                assignee = rng.choice(team)
+                task = Task(
+                    project=project, title=rng.choice(TASK_TITLES), department=rng.choice(['photo', 'video']),
+                    priority=rng.choice(['low', 'medium', 'high']), assigned_to=assignee.name, assignee=assignee,
+                    due_date=project.event_date + timedelta(days=rng.randint(-14, 60)),
+                    estimated_hours=rng.randint(1, 16),
+                    status='completed' if project.status == 'completed' else rng.choice(['pending', 'in_progress', 'completed']),
+                )
+                # Cards numbered in creation order within each board column
+                task.position = next(positions[task.status])
+                tasks.append(task)
+        self.bulk_create(Event, events)
+        # Crew names are unique per event and role except for duplicate generated names
+        EventAssignment.objects.bulk_create(assignments, batch_size=self.batch_size, ignore_conflicts=True)
+        self.bulk_create(Task, tasks)
+
+        checklists, submissions = [], []
+        for event in events:
+            for item_name, category in rng.sample(CHECKLIST_ITEMS, min(options['checklists_per_event'], len(CHECKLIST_ITEMS))):
+                checklists.append(EventChecklist(
+                    event=event, item_name=item_name, category=category,
+                    is_completed=event.status == 'completed' or rng.random() < 0.3,
+                ))
+            if event.status != 'completed':
+                continue
+            for n in range(options['submissions_per_event']):
+                file_type = rng.choice(['image', 'video'])
+                extension = 'jpg' if file_type == 'image' else 'mp4'
+                contact = rng.choice(contacts[event.project.user_id])
+                submissions.append(FileSubmission(
+                    event=event, team_member_name=contact.name, team_member_role=contact.role,
+                    file_name=f"{event.event_name.lower().replace(' ', '_')}_{n + 1}.{extension}",
+                    file_url=f"https://files.example.com/{event.id}/{n + 1}.{extension}",
+                    file_type=file_type, submission_type=rng.choice(['raw', 'edited']),
+                    review_status=rng.choice(['pending', 'approved', 'rejected']),
+                ))
+        self.bulk_create(EventChecklist, checklists)
+        self.bulk_create(FileSubmission, submissions)
+
+        rebuild_studio_stats([owner.pk for owner in owners])
+
+        return {
+            'users': len(users),
+            'contacts': sum(len(team) for team in contacts.values()),
+            'projects': len(projects),
+            'events': len(events),
+            'tasks': len(tasks),
+            'checklists': len(checklists),
+            'submissions': len(submissions),
+        }
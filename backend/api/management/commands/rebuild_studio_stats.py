@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.models import StudioStats, rebuild_studio_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-owner dashboard counters (StudioStats) from projects and contacts."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--owner', type=int, action='append', dest='owners', help="Only rebuild these user ids")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rebuild_studio_stats(options['owners'])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt studio stats: {StudioStats.objects.count()} rows"))
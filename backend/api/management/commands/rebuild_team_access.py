@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.models import TeamAccess, rebuild_team_access
+
+
+class Command(BaseCommand):
+    help = "Rebuild the TeamAccess table from TeamMemberContact (e.g. after bulk updates that skip signals)."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rebuild_team_access()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt team access: {TeamAccess.objects.count()} rows"))
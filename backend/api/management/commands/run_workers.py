@@ -0,0 +1,46 @@
+import signal
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.jobs import Worker
+
+
+class Command(BaseCommand):
+    help = "Run background job workers (outbound email, ...) until interrupted."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=getattr(settings, 'JOB_WORKERS', 2), help="Number of worker threads")
+        parser.add_argument('--batch-size', type=int, default=None, help="Jobs claimed per query")
+        parser.add_argument('--poll-interval', type=float, default=None, help="Seconds to sleep when the queue is empty")
+        parser.add_argument('--once', action='store_true', help="Exit once no jobs are due instead of polling")
+
+    def handle(self, *args, **options):
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+        def make_worker():
+            return Worker(batch_size=options['batch_size'], poll_interval=options['poll_interval'])
+
+        threads = []
+        try:
+            if options['workers'] <= 1:
+                make_worker().run(stop, once=options['once'])
+            else:
+                for n in range(options['workers']):
+                    thread = threading.Thread(
+                        target=make_worker().run_in_thread, args=(stop, options['once']),
+                        name=f'job-worker-{n}', daemon=True,
+                    )
+                    thread.start()
+                    threads.append(thread)
+                for thread in threads:
+                    while thread.is_alive():
+                        thread.join(timeout=1)
+        except KeyboardInterrupt:
+            stop.set()
+        # After SIGTERM or Ctrl-C, let each worker finish the batch it claimed
+        for thread in threads:
+            thread.join()
+        self.stdout.write(self.style.SUCCESS("Job workers stopped"))
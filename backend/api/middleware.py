@@ -0,0 +1,193 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from rest_framework.permissions import SAFE_METHODS
+
+from .routers import RoutingState, pin_to_primary, routing_state
+
+logger = logging.getLogger('api.performance')
+
+
+class DatabaseRoutingMiddleware:
+    """
+    Scope replica routing to the request and pin users who wrote to the
+    primary for REPLICA_PIN_SECONDS, so their next reads see their writes.
+
+    Sync and async capable, so ASGI requests to async views are not moved to
+    a thread on its account.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = RoutingState()
+        token = routing_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            routing_state.reset(token)
+        self.pin_writer(request, state)
+        return response
+
+    async def __acall__(self, request):
+        state = RoutingState()
+        token = routing_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            routing_state.reset(token)
+        if self.wrote(request, state):
+            # request.user may still be the lazy session user, which queries
+            await sync_to_async(self.pin_writer)(request, state)
+        return response
+
+    @staticmethod
+    def wrote(request, state):
+        return state.wrote or request.method not in SAFE_METHODS
+
+    def pin_writer(self, request, state):
+        if self.wrote(request, state):
+            user = getattr(request, 'user', None)
+            if user is not None and user.is_authenticated:
+                pin_to_primary(user.pk)
+
+
+# `IN (%s, %s, %s)` and `VALUES (%s, ...), (%s, ...)` vary with the batch size
+_PLACEHOLDER_RUN = re.compile(r'%s(?:\s*,\s*%s)+')
+_VALUES_RUN = re.compile(r'\(%s\)(?:\s*,\s*\(%s\))+')
+
+
+def query_shape(sql):
+    """The statement with runs of placeholders collapsed, so per-row lookups compare equal."""
+    return _VALUES_RUN.sub('(%s)', _PLACEHOLDER_RUN.sub('%s', sql))
+
+
+class QueryRecorder:
+    """connection.execute_wrapper() that records (alias, sql, seconds) for every statement."""
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((context['connection'].alias, sql, time.perf_counter() - start))
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def duration(self):
+        return sum(seconds for _, _, seconds in self.queries)
+
+    def slowest(self, limit):
+        return sorted(self.queries, key=lambda query: query[2], reverse=True)[:limit]
+
+    def repeated(self, threshold):
+        """Query shapes executed at least `threshold` times, most frequent first."""
+        shapes = Counter(query_shape(sql) for _, sql, _ in self.queries)
+        return [(shape, count) for shape, count in shapes.most_common() if count >= threshold]
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Record the SQL each request runs and report it in a Server-Timing header
+    (`sql` time and query count, `app` time outside the database, `total`).
+
+    Requests slower than SLOW_REQUEST_MS are logged to `api.performance` with
+    their slowest statements. With QUERY_REPEAT_DETECTION on, a request that
+    runs the same query shape QUERY_REPEAT_THRESHOLD times or more (an N+1,
+    e.g. a per-row `request.user.profile` or nested serializer lookup) is
+    logged too.
+    """
+    slow_query_log_limit = 10
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not getattr(settings, 'REQUEST_TIMING_ENABLED', True):
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with self.record_queries(recorder):
+            response = self.get_response(request)
+        return self.report(request, response, recorder, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        if not getattr(settings, 'REQUEST_TIMING_ENABLED', True):
+            return await self.get_response(request)
+
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        # Async views run their queries through sync_to_async, on the request's
+        # sync thread and its own connections, so the wrappers go there
+        queries = await sync_to_async(self.record_queries)(recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(queries.close)()
+        return self.report(request, response, recorder, time.perf_counter() - start)
+
+    @staticmethod
+    def record_queries(recorder):
+        stack = ExitStack()
+        for conn in connections.all():
+            stack.enter_context(conn.execute_wrapper(recorder))
+        return stack
+
+    def report(self, request, response, recorder, total):
+        sql = recorder.duration
+        response['Server-Timing'] = (
+            f'sql;dur={sql * 1000:.1f};desc="{recorder.count} queries", '
+            f'app;dur={(total - sql) * 1000:.1f}, '
+            f'total;dur={total * 1000:.1f}'
+        )
+        self.log_slow_request(request, response, recorder, total)
+        self.log_repeated_queries(request, recorder)
+        return response
+
+    def log_slow_request(self, request, response, recorder, total):
+        threshold = getattr(settings, 'SLOW_REQUEST_MS', 500)
+        if threshold is None or total * 1000 < threshold:
+            return
+        statements = '\n'.join(
+            f'  {seconds * 1000:.1f}ms [{alias}] {sql}'
+            for alias, sql, seconds in recorder.slowest(self.slow_query_log_limit)
+        )
+        logger.warning(
+            "Slow request %s %s -> %s: %.1fms total, %d queries in %.1fms\n%s",
+            request.method, request.path, response.status_code,
+            total * 1000, recorder.count, recorder.duration * 1000, statements,
+        )
+
+    def log_repeated_queries(self, request, recorder):
+        if not getattr(settings, 'QUERY_REPEAT_DETECTION', False):
+            return
+        for shape, count in recorder.repeated(getattr(settings, 'QUERY_REPEAT_THRESHOLD', 5)):
+            logger.warning(
+                "Possible N+1 in %s %s: query ran %d times: %s",
+                request.method, request.path, count, shape,
+            )
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:05
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_team_access(apps, schema_editor):
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    TeamMemberContact = apps.get_model('api', 'TeamMemberContact')
+    TeamAccess = apps.get_model('api', 'TeamAccess')
+
+    owners_by_email = {}
+    contacts = TeamMemberContact.objects.filter(
+        status__in=['sent', 'joined'], owner__isnull=False,
+    ).exclude(email__isnull=True).exclude(email='').values_list('email', 'owner_id')
+    for email, owner_id in contacts:
+        owners_by_email.setdefault(email, set()).add(owner_id)
+
+    members = User.objects.filter(email__in=owners_by_email.keys()).values_list('id', 'email')
+    TeamAccess.objects.bulk_create(
+        [TeamAccess(id=uuid.uuid4(), member_id=member_id, owner_id=owner_id)
+         for member_id, email in members for owner_id in owners_by_email[email]],
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_event_end_date'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TeamAccess',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('member', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='team_access', to=settings.AUTH_USER_MODEL)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='team_member_access', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('member', 'owner'), name='unique_team_access_member_owner')],
+            },
+        ),
+        migrations.RunPython(backfill_team_access, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:09
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+CREW_ROLE_FIELDS = ['photographer', 'cinematographer', 'drone_operator', 'site_manager', 'assistant']
+
+
+def backfill_event_assignments(apps, schema_editor):
+    Event = apps.get_model('api', 'Event')
+    EventAssignment = apps.get_model('api', 'EventAssignment')
+    TeamMemberContact = apps.get_model('api', 'TeamMemberContact')
+
+    contacts = {}
+    for owner_id, name, contact_id in TeamMemberContact.objects.values_list('owner_id', 'name', 'id'):
+        contacts.setdefault((owner_id, name.strip().lower()), contact_id)
+
+    batch = []
+    events = Event.objects.values_list('id', 'project__user_id', *CREW_ROLE_FIELDS)
+    for event_id, owner_id, *columns in events.iterator(chunk_size=2000):
+        seen = set()
+        for role, value in zip(CREW_ROLE_FIELDS, columns):
+            for name in (value or '').split(','):
+                name = name.strip()
+                key = name.lower()
+                if not name or (role, key) in seen:
+                    continue
+                seen.add((role, key))
+                batch.append(EventAssignment(
+                    id=uuid.uuid4(), event_id=event_id, role=role, member_name=name,
+                    name_key=key, member_id=contacts.get((owner_id, key)),
+                ))
+        if len(batch) >= 2000:
+            EventAssignment.objects.bulk_create(batch)
+            batch = []
+    EventAssignment.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_teamaccess'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventAssignment',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('role', models.TextField(choices=[('photographer', 'Photographer'), ('cinematographer', 'Cinematographer'), ('drone_operator', 'Drone Operator'), ('site_manager', 'Site Manager'), ('assistant', 'Assistant')])),
+                ('member_name', models.TextField()),
+                ('name_key', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignments', to='api.event')),
+                ('member', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='event_assignments', to='api.teammembercontact')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['name_key', 'event'], name='eventassign_name_event_idx')],
+                'constraints': [models.UniqueConstraint(fields=('event', 'role', 'name_key'), name='unique_event_assignment_role')],
+            },
+        ),
+        migrations.RunPython(backfill_event_assignments, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:11
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+TRIGRAM_INDEX = django.contrib.postgres.indexes.GinIndex(
+    django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('assigned_to'), name='gin_trgm_ops'),
+    name='task_assigned_trgm_idx',
+)
+
+
+def add_trigram_index(apps, schema_editor):
+    # pg_trgm ships with the standard Postgres images but is an optional
+    # contrib module; without it icontains keeps working, just unindexed.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.add_index(apps.get_model('api', 'Task'), TRIGRAM_INDEX)
+
+
+def remove_trigram_index(apps, schema_editor):
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{TRIGRAM_INDEX.name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_eventassignment'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['project', 'event_date'], name='event_project_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='filesubmission',
+            index=models.Index(models.F('event'), django.db.models.functions.text.Upper('team_member_name'), name='submission_event_member_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'due_date'], name='task_project_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(django.db.models.functions.text.Upper('assigned_to'), name='task_assigned_upper_idx'),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='task',
+                    index=TRIGRAM_INDEX,
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(add_trigram_index, remove_trigram_index),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='teammembercontact',
+            index=models.Index(fields=['email', 'status'], name='contact_email_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teammembercontact',
+            index=models.Index(fields=['invitation_token'], name='contact_invitation_token_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weddingproject',
+            index=models.Index(fields=['user', 'status'], name='project_user_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weddingproject',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['user'], name='project_user_active_idx'),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:13
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_studio_stats(apps, schema_editor):
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    StudioStats = apps.get_model('api', 'StudioStats')
+
+    rows = User.objects.annotate(
+        active_count=models.Count('projects', filter=models.Q(projects__status='active'), distinct=True),
+        contact_count=models.Count('team_contacts', distinct=True),
+    ).values_list('pk', 'active_count', 'contact_count')
+    StudioStats.objects.bulk_create(
+        StudioStats(owner_id=pk, active_projects=active, team_members=contacts)
+        for pk, active, contacts in rows
+    )
+
+    # Plain INSERT ... SELECT keeps the original timestamps (auto_now_add would overwrite them)
+    schema_editor.execute(
+        "INSERT INTO api_studioactivity (id, owner_id, action, details, status, created_at) "
+        "SELECT gen_random_uuid(), user_id, 'New project created', couple_name || ' - ' || event_type, 'success', created_at "
+        "FROM api_weddingproject"
+    )
+    schema_editor.execute(
+        "INSERT INTO api_studioactivity (id, owner_id, action, details, status, created_at) "
+        "SELECT gen_random_uuid(), owner_id, 'Team member invited', name || ' as ' || role, 'pending', created_at "
+        "FROM api_teammembercontact WHERE owner_id IS NOT NULL"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_index_pack'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudioStats',
+            fields=[
+                ('owner', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='studio_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('active_projects', models.IntegerField(default=0)),
+                ('team_members', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='StudioActivity',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('action', models.TextField()),
+                ('details', models.TextField()),
+                ('status', models.TextField(default='success')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='studio_activity', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['owner', '-created_at'], name='activity_owner_created_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_studio_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models.functions import Lower, Trim
+
+
+def backfill_task_assignees(apps, schema_editor):
+    """
+    Link existing tasks to the owner's contact their assigned_to names: first
+    by contact name, then by the full name of the user registered with the
+    contact's email (the name the old profile-based filter matched). The
+    earliest contact wins when names repeat; unmatched tasks stay unlinked.
+    """
+    Task = apps.get_model('api', 'Task')
+    TeamMemberContact = apps.get_model('api', 'TeamMemberContact')
+    Profile = apps.get_model('api', 'Profile')
+
+    contacts = list(
+        TeamMemberContact.objects.filter(owner__isnull=False)
+        .order_by('created_at').values_list('id', 'owner_id', 'name', 'email')
+    )
+    full_names = dict(
+        Profile.objects.filter(user__email__in={email for *_, email in contacts if email})
+        .exclude(full_name__isnull=True).exclude(full_name='')
+        .values_list('user__email', 'full_name')
+    )
+
+    keys = {}
+    for contact_id, owner_id, name, _ in contacts:
+        keys.setdefault((owner_id, name.strip().lower()), contact_id)
+    for contact_id, owner_id, _, email in contacts:
+        if email in full_names:
+            keys.setdefault((owner_id, full_names[email].strip().lower()), contact_id)
+
+    tasks = Task.objects.annotate(name_key=Lower(Trim('assigned_to'))).filter(assignee__isnull=True)
+    for (owner_id, key), contact_id in keys.items():
+        if key:
+            tasks.filter(project__user_id=owner_id, name_key=key).update(assignee_id=contact_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_search_vectors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='assignee',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='assigned_tasks', to='api.teammembercontact'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee', 'due_date'], name='task_assignee_due_idx'),
+        ),
+        migrations.RunPython(backfill_task_assignees, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_task_assignee'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='position',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        # Number existing columns by due date, the order task lists use
+        migrations.RunSQL(
+            """
+            UPDATE api_task SET position = ranked.position
+            FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY project_id, status ORDER BY due_date NULLS LAST, created_at, id
+                ) - 1 AS position
+                FROM api_task
+            ) AS ranked
+            WHERE api_task.id = ranked.id
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'status', 'position'], name='task_board_idx'),
+        ),
+    ]
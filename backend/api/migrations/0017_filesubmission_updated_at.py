@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_task_position'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='filesubmission',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        # Existing rows were last changed when reviewed, or else when uploaded
+        migrations.RunSQL(
+            "UPDATE api_filesubmission SET updated_at = COALESCE(reviewed_at, uploaded_at)",
+            migrations.RunSQL.noop,
+        ),
+    ]
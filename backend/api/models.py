@@ -1,11 +1,92 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.contrib.postgres.fields import ArrayField
-from django.db.models.signals import post_save
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db.models import F, Max
+from django.db.models.functions import Upper
+from django.db.models.signals import post_init, post_save, pre_save, post_delete
 from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+import copy
 import uuid
 
-class Profile(models.Model):
+from .authentication import invalidate_cached_tokens
+# Text search configuration of the stored search vectors and of /api/search/ queries
+SEARCH_CONFIG = 'english'
+
+
+def search_vector_field(*weighted_columns):
+    """
+    A stored tsvector over `(column, weight)` pairs for /api/search/. Postgres
+    computes it on every INSERT/UPDATE, bulk writes included.
+    """
+    vector = None
+    for column, weight in weighted_columns:
+        part = SearchVector(column, weight=weight, config=SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return models.GeneratedField(expression=vector, output_field=SearchVectorField(), db_persist=True)
+
+
+class DirtyFieldsMixin:
+    """
+    Track which columns changed since the row was loaded (or last saved), so
+    save() writes only those plus auto_now timestamps via update_fields.
+
+    A save that changes nothing skips the UPDATE and the save signals, as an
+    empty update_fields does in Django. Inserts, explicit update_fields and
+    primary-key changes save as usual.
+    """
+    def _snapshot_fields(self):
+        state = self.__dict__
+        return {
+            field.attname: copy.deepcopy(state[field.attname])
+            if isinstance(state[field.attname], (list, dict)) else state[field.attname]
+            for field in self._meta.concrete_fields if field.attname in state
+        }
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = instance._snapshot_fields()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        snapshot = self._snapshot_fields()
+        if fields is not None:
+            attnames = {getattr(self._meta.get_field(name), 'attname', None) for name in fields}
+            snapshot = {**getattr(self, '_loaded_values', {}), **{k: v for k, v in snapshot.items() if k in attnames}}
+        self._loaded_values = snapshot
+
+    def get_dirty_fields(self):
+        """Names of the concrete fields whose value differs from the database."""
+        loaded = getattr(self, '_loaded_values', None) or {}
+        state = self.__dict__
+        return {
+            field.name for field in self._meta.concrete_fields
+            if field.attname in state and (field.attname not in loaded or state[field.attname] != loaded[field.attname])
+        }
+
+    def save(self, *args, **kwargs):
+        if (
+            getattr(self, '_loaded_values', None) is not None
+            and not self._state.adding
+            and not args
+            and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+        ):
+            dirty = self.get_dirty_fields()
+            if self._meta.pk.name not in dirty:
+                if dirty:
+                    dirty |= {field.name for field in self._meta.concrete_fields if getattr(field, 'auto_now', False)}
+                kwargs['update_fields'] = sorted(dirty)
+        super().save(*args, **kwargs)
+        self._loaded_values = self._snapshot_fields()
+
+
+class Profile(DirtyFieldsMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
     full_name = models.TextField(blank=True, null=True)
@@ -48,11 +129,30 @@ def create_user_profile(sender, instance, created, **kwargs):
         Profile.objects.create(user=instance, id=uuid.uuid4())
 
 @receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
+def save_user_profile(sender, instance, created, **kwargs):
+    # Only a profile already loaded on this user can hold unsaved changes, and
+    # DirtyFieldsMixin makes the save a no-op when it holds none (e.g. last_login updates)
+    if created or not User.profile.related.is_cached(instance):
+        return
     instance.profile.save()
 
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(sender, instance, update_fields=None, **kwargs):
+    # Password, is_active or profile changes must not be served from the token cache
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_cached_tokens(*Token.objects.filter(user_id=instance.pk).values_list('key', flat=True))
 
-class WeddingProject(models.Model):
+@receiver(post_save, sender=Profile)
+def invalidate_profile_tokens(sender, instance, **kwargs):
+    invalidate_cached_tokens(*Token.objects.filter(user_id=instance.user_id).values_list('key', flat=True))
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    invalidate_cached_tokens(instance.key)
+
+
+class WeddingProject(DirtyFieldsMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='projects')
     couple_name = models.TextField()
@@ -77,12 +177,20 @@ class WeddingProject(models.Model):
     progress_percentage = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = search_vector_field(('couple_name', 'A'), ('location', 'B'))
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='project_search_idx'),
+            models.Index(fields=['user', 'status'], name='project_user_status_idx'),
+            models.Index(fields=['user'], condition=models.Q(status='active'), name='project_user_active_idx'),
+        ]
 
     def __str__(self):
         return f"{self.couple_name} - {self.event_type}"
 
 
-class Event(models.Model):
+class Event(DirtyFieldsMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     project = models.ForeignKey(WeddingProject, on_delete=models.CASCADE, related_name='events')
     event_name = models.TextField()
@@ -110,9 +218,82 @@ class Event(models.Model):
     sample_image_url = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = search_vector_field(('event_name', 'A'), ('location', 'B'), ('details', 'C'))
+
+    # Legacy free-text crew columns, mirrored into EventAssignment rows
+    CREW_ROLE_FIELDS = ['photographer', 'cinematographer', 'drone_operator', 'site_manager', 'assistant']
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['project', 'event_date'], name='event_project_date_idx'),
+            GinIndex(fields=['search_vector'], name='event_search_idx'),
+        ]
+
+
+class EventAssignment(models.Model):
+    """
+    One crew member on one event in one role, parsed from the comma-separated
+    crew columns on Event so "events assigned to X" is an indexed lookup.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='assignments')
+    member = models.ForeignKey('TeamMemberContact', on_delete=models.SET_NULL, related_name='event_assignments', null=True, blank=True)
+    role = models.TextField(choices=[(field, field.replace('_', ' ').title()) for field in Event.CREW_ROLE_FIELDS])
+    member_name = models.TextField()
+    # Lower-cased member_name used for case-insensitive lookups
+    name_key = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['name_key', 'event'], name='eventassign_name_event_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['event', 'role', 'name_key'], name='unique_event_assignment_role'),
+        ]
 
 
-class Task(models.Model):
+def parse_crew_names(value):
+    """Split a legacy crew column ("Ann, Bob") into clean names."""
+    if not value:
+        return []
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def sync_event_assignments(events):
+    """Replace the EventAssignment rows of `events` from their crew columns."""
+    assignments = {}
+    for event in events:
+        for role in Event.CREW_ROLE_FIELDS:
+            for name in parse_crew_names(getattr(event, role)):
+                assignments.setdefault((event, role, name.lower()), name)
+
+    contacts = {}
+    if assignments:
+        owner_contacts = TeamMemberContact.objects.filter(
+            owner__projects__in={event.project_id for event in events},
+        ).values_list('owner__projects', 'name', 'id')
+        for project_id, name, contact_id in owner_contacts:
+            contacts.setdefault((project_id, name.strip().lower()), contact_id)
+
+    EventAssignment.objects.filter(event__in=events).delete()
+    EventAssignment.objects.bulk_create([
+        EventAssignment(
+            event=event, role=role, member_name=name, name_key=key,
+            member_id=contacts.get((event.project_id, key)),
+        )
+        for (event, role, key), name in assignments.items()
+    ])
+
+
+@receiver(post_save, sender=Event)
+def update_event_assignments(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(Event.CREW_ROLE_FIELDS):
+        return
+    sync_event_assignments([instance])
+
+
+class Task(DirtyFieldsMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     project = models.ForeignKey(WeddingProject, on_delete=models.CASCADE, related_name='tasks')
     title = models.TextField()
@@ -126,16 +307,92 @@ class Task(models.Model):
     category = models.TextField(blank=True, null=True)
     priority = models.TextField(blank=True, null=True)
     due_date = models.DateField(blank=True, null=True)
+    # Legacy free-text assignee, kept readable and mirrored from `assignee`
     assigned_to = models.TextField(blank=True, null=True)
+    assignee = models.ForeignKey(
+        'TeamMemberContact', on_delete=models.SET_NULL, related_name='assigned_tasks', null=True, blank=True,
+        db_index=False,  # covered by task_assignee_due_idx
+    )
     estimated_hours = models.IntegerField(blank=True, null=True)
     description = models.TextField(blank=True, null=True)
     expected_deliverables = models.TextField(blank=True, null=True)
     status = models.TextField(default='pending')
+    # Order within its status column on the task board
+    position = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = search_vector_field(('title', 'A'), ('description', 'C'))
+
+    # Written together: link_task_assignees() derives one from the other
+    ASSIGNEE_FIELDS = ['assignee', 'assigned_to']
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['project', 'due_date'], name='task_project_due_idx'),
+            models.Index(fields=['assignee', 'due_date'], name='task_assignee_due_idx'),
+            models.Index(fields=['project', 'status', 'position'], name='task_board_idx'),
+            # assigned_to is matched with iexact / icontains, which compare UPPER(assigned_to)
+            models.Index(Upper('assigned_to'), name='task_assigned_upper_idx'),
+            GinIndex(OpClass(Upper('assigned_to'), name='gin_trgm_ops'), name='task_assigned_trgm_idx'),
+            GinIndex(fields=['search_vector'], name='task_search_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or set(update_fields) & set(self.ASSIGNEE_FIELDS):
+            link_task_assignees([self])
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, *self.ASSIGNEE_FIELDS}
+        super().save(*args, **kwargs)
+
 
+def link_task_assignees(tasks):
+    """
+    Keep `assignee` and the legacy `assigned_to` name in step on unsaved
+    tasks: a newly set assignee is copied into `assigned_to`, and a newly set
+    `assigned_to` is linked to the project owner's contact of that name
+    (case-insensitive), or unlinked when no contact matches.
+    """
+    unresolved = []
+    for task in tasks:
+        dirty = task.get_dirty_fields()
+        if task.assignee_id and (task._state.adding or 'assignee' in dirty):
+            task.assigned_to = task.assignee.name
+        elif 'assignee' in dirty and not task._state.adding:
+            task.assigned_to = None
+        elif 'assigned_to' in dirty:
+            unresolved.append(task)
 
-class EventChecklist(models.Model):
+    contacts = {}
+    if any(task.assigned_to and task.assigned_to.strip() for task in unresolved):
+        owner_contacts = TeamMemberContact.objects.filter(
+            owner__projects__in={task.project_id for task in unresolved},
+        ).order_by('created_at').values_list('owner__projects', 'name', 'id')
+        for project_id, name, contact_id in owner_contacts:
+            contacts.setdefault((project_id, name.strip().lower()), contact_id)
+    for task in unresolved:
+        task.assignee_id = contacts.get((task.project_id, (task.assigned_to or '').strip().lower()))
+
+
+def append_tasks_to_board(tasks):
+    """
+    Give unsaved tasks the positions after the last card of their project's
+    status column, in list order, read with one aggregate over task_board_idx.
+    """
+    if not tasks:
+        return
+    last = {
+        (row['project_id'], row['status']): row['last']
+        for row in Task.objects.filter(
+            project_id__in={task.project_id for task in tasks}, status__in={task.status for task in tasks},
+        ).values('project_id', 'status').annotate(last=Max('position'))
+    }
+    for task in tasks:
+        key = (task.project_id, task.status)
+        task.position = last[key] = last.get(key, -1) + 1
+
+
+class EventChecklist(DirtyFieldsMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='checklists')
     item_name = models.TextField()
@@ -147,7 +404,7 @@ class EventChecklist(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
 
-class FileSubmission(models.Model):
+class FileSubmission(DirtyFieldsMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='submissions')
     team_member_name = models.TextField()
@@ -160,9 +417,15 @@ class FileSubmission(models.Model):
     uploaded_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(blank=True, null=True)
     reviewer_notes = models.TextField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(F('event'), Upper('team_member_name'), name='submission_event_member_idx'),
+        ]
 
 
-class TeamMemberContact(models.Model):
+class TeamMemberContact(DirtyFieldsMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='team_contacts', null=True, blank=True)
     name = models.TextField()
@@ -186,8 +449,122 @@ class TeamMemberContact(models.Model):
     # Categories: 'crew', 'post_production'
     category = ArrayField(models.CharField(max_length=50), default=list, blank=True)
 
+    search_vector = search_vector_field(('name', 'A'), ('role', 'B'))
 
-class UserPreference(models.Model):
+    # Statuses that grant the contact's user access to the owner's data
+    ACCESS_STATUSES = ['sent', 'joined']
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='contact_search_idx'),
+            models.Index(fields=['email', 'status'], name='contact_email_status_idx'),
+            models.Index(fields=['invitation_token'], name='contact_invitation_token_idx'),
+        ]
+
+
+class TeamAccess(models.Model):
+    """
+    Materialized team graph: one row per (member user, owner) pair where the
+    member can see the owner's projects. Derived from TeamMemberContact and
+    kept in sync by the signals below, so viewsets can filter on a plain
+    list of owner ids instead of a per-request subquery.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    member = models.ForeignKey(User, on_delete=models.CASCADE, related_name='team_access')
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='team_member_access')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['member', 'owner'], name='unique_team_access_member_owner'),
+        ]
+
+
+def _accessible_owner_ids(email):
+    if not email:
+        return set()
+    return set(
+        TeamMemberContact.objects.filter(
+            email=email,
+            status__in=TeamMemberContact.ACCESS_STATUSES,
+            owner__isnull=False,
+        ).values_list('owner_id', flat=True)
+    )
+
+def _replace_team_access(member_ids, owner_ids):
+    TeamAccess.objects.filter(member_id__in=member_ids).exclude(owner_id__in=owner_ids).delete()
+    TeamAccess.objects.bulk_create(
+        [TeamAccess(member_id=member_id, owner_id=owner_id) for member_id in member_ids for owner_id in owner_ids],
+        ignore_conflicts=True,
+    )
+
+def sync_team_access(email):
+    """Recompute the TeamAccess rows of every user registered with `email`."""
+    if not email:
+        return
+    member_ids = list(User.objects.filter(email=email).values_list('id', flat=True))
+    if member_ids:
+        _replace_team_access(member_ids, _accessible_owner_ids(email))
+
+def rebuild_team_access():
+    """Rebuild the whole TeamAccess table from TeamMemberContact."""
+    TeamAccess.objects.all().delete()
+    pairs = (
+        TeamMemberContact.objects.filter(
+            status__in=TeamMemberContact.ACCESS_STATUSES,
+            owner__isnull=False,
+        )
+        .exclude(email__isnull=True).exclude(email='')
+        .values_list('email', 'owner_id')
+    )
+    owners_by_email = {}
+    for email, owner_id in pairs:
+        owners_by_email.setdefault(email, set()).add(owner_id)
+    members = User.objects.filter(email__in=owners_by_email.keys()).values_list('id', 'email')
+    TeamAccess.objects.bulk_create(
+        [TeamAccess(member_id=member_id, owner_id=owner_id) for member_id, email in members for owner_id in owners_by_email[email]],
+        ignore_conflicts=True,
+    )
+
+
+@receiver(pre_save, sender=TeamMemberContact)
+def remember_contact_email(sender, instance, **kwargs):
+    # The email may change on update; the old address loses access in post_save
+    if instance._state.adding:
+        instance._previous_email = None
+    else:
+        instance._previous_email = sender.objects.filter(pk=instance.pk).values_list('email', flat=True).first()
+
+@receiver(post_save, sender=TeamMemberContact)
+def update_team_access_on_contact_save(sender, instance, **kwargs):
+    previous_email = getattr(instance, '_previous_email', None)
+    if previous_email and previous_email != instance.email:
+        sync_team_access(previous_email)
+    sync_team_access(instance.email)
+
+@receiver(post_save, sender=TeamMemberContact)
+def rename_assigned_tasks(sender, instance, created, update_fields=None, **kwargs):
+    # Linked tasks show the contact's current name in the legacy column; the
+    # updated_at bump changes their list and detail ETags
+    if created or (update_fields is not None and 'name' not in update_fields):
+        return
+    Task.objects.filter(assignee=instance).exclude(assigned_to=instance.name).update(
+        assigned_to=instance.name, updated_at=timezone.now(),
+    )
+
+@receiver(post_delete, sender=TeamMemberContact)
+def update_team_access_on_contact_delete(sender, instance, **kwargs):
+    sync_team_access(instance.email)
+
+@receiver(post_save, sender=User)
+def update_team_access_on_user_save(sender, instance, created, update_fields=None, **kwargs):
+    # Contacts may be added before the member signs up, and members may change email
+    if update_fields is not None and 'email' not in update_fields:
+        return
+    _replace_team_access([instance.pk], _accessible_owner_ids(instance.email))
+
+
+class UserPreference(DirtyFieldsMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='preferences')
     theme = models.TextField(default='system')
@@ -202,3 +579,136 @@ class UserPreference(models.Model):
     weekly_summary = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+
+class StudioStats(models.Model):
+    """
+    Per-owner dashboard counters, kept current with F() increments by the
+    signals below so DashboardStatsView is a single indexed read.
+    `manage.py rebuild_studio_stats` recomputes them if they drift.
+    """
+    owner = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='studio_stats')
+    active_projects = models.IntegerField(default=0)
+    team_members = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class StudioActivity(models.Model):
+    """Append-only activity feed shown on the owner's dashboard."""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='studio_activity')
+    action = models.TextField()
+    details = models.TextField()
+    status = models.TextField(default='success')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['owner', '-created_at'], name='activity_owner_created_idx'),
+        ]
+
+
+def rebuild_studio_stats(owner_ids=None):
+    """Recompute StudioStats from scratch, for every user or only `owner_ids`."""
+    users = User.objects.all()
+    if owner_ids is not None:
+        users = users.filter(pk__in=owner_ids)
+    rows = users.annotate(
+        active_count=models.Count('projects', filter=models.Q(projects__status='active'), distinct=True),
+        contact_count=models.Count('team_contacts', distinct=True),
+    ).values_list('pk', 'active_count', 'contact_count')
+    StudioStats.objects.bulk_create(
+        [StudioStats(owner_id=pk, active_projects=active, team_members=contacts) for pk, active, contacts in rows],
+        update_conflicts=True,
+        unique_fields=['owner'],
+        update_fields=['active_projects', 'team_members', 'updated_at'],
+    )
+
+
+def bump_studio_stats(owner_id, **deltas):
+    """Apply counter deltas, e.g. bump_studio_stats(owner_id, active_projects=1)."""
+    if owner_id is None:
+        return
+    updated = StudioStats.objects.filter(owner_id=owner_id).update(
+        updated_at=timezone.now(),
+        **{field: F(field) + delta for field, delta in deltas.items()},
+    )
+    if not updated and any(delta > 0 for delta in deltas.values()):
+        # First change for this owner: counting from scratch already includes it.
+        # Decrements skip this, as they also fire while the owner is being deleted.
+        rebuild_studio_stats([owner_id])
+
+
+@receiver(post_init, sender=WeddingProject)
+def remember_project_status(sender, instance, **kwargs):
+    # Read from __dict__ so deferred loads don't trigger a query per row
+    instance._original_status = instance.__dict__.get('status')
+
+@receiver(post_save, sender=WeddingProject)
+def update_stats_on_project_save(sender, instance, created, **kwargs):
+    was_active = not created and getattr(instance, '_original_status', None) == 'active'
+    is_active = instance.status == 'active'
+    if was_active != is_active:
+        bump_studio_stats(instance.user_id, active_projects=1 if is_active else -1)
+    instance._original_status = instance.status
+    if created:
+        StudioActivity.objects.create(
+            owner_id=instance.user_id,
+            action='New project created',
+            details=f"{instance.couple_name} - {instance.event_type}",
+        )
+
+@receiver(post_delete, sender=WeddingProject)
+def update_stats_on_project_delete(sender, instance, **kwargs):
+    if getattr(instance, '_original_status', None) == 'active':
+        bump_studio_stats(instance.user_id, active_projects=-1)
+
+@receiver(post_save, sender=TeamMemberContact)
+def update_stats_on_contact_save(sender, instance, created, **kwargs):
+    if created and instance.owner_id:
+        bump_studio_stats(instance.owner_id, team_members=1)
+        StudioActivity.objects.create(
+            owner_id=instance.owner_id,
+            action='Team member invited',
+            details=f"{instance.name} as {instance.role}",
+            status='pending',
+        )
+
+@receiver(post_delete, sender=TeamMemberContact)
+def update_stats_on_contact_delete(sender, instance, **kwargs):
+    bump_studio_stats(instance.owner_id, team_members=-1)
+
+
+class Job(models.Model):
+    """
+    A unit of background work (e.g. an outbound email), run by
+    `manage.py run_workers`. Workers claim queued rows with
+    SELECT ... FOR UPDATE SKIP LOCKED; see api.jobs.
+    """
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.TextField()
+    payload = models.JSONField(default=dict)
+    status = models.TextField(choices=STATUS_CHOICES, default='queued')
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['run_after'], condition=models.Q(status='queued'), name='job_queued_run_after_idx'),
+            models.Index(fields=['locked_at'], condition=models.Q(status='running'), name='job_running_locked_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} ({self.status})"
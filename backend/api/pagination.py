@@ -0,0 +1,223 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only keyset (cursor) pagination.
+
+    Rows are ordered on the view's `pagination_ordering` (which must end with
+    a unique column such as `id`) and each page continues strictly after the
+    last row of the previous one, so deep pages cost the same as the first.
+
+    Pagination is opt-in: a request is paginated when it sends `cursor` or
+    `page_size`. Setting API_PAGINATE_BY_DEFAULT turns it on for every list
+    request; until then existing clients keep receiving plain lists.
+    """
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    max_page_size = 500
+    ordering = ('created_at', 'id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    def __init__(self):
+        self.page_size = settings.REST_FRAMEWORK.get('PAGE_SIZE') or 50
+
+    def is_requested(self, request):
+        params = request.query_params
+        return (
+            getattr(settings, 'API_PAGINATE_BY_DEFAULT', False)
+            or self.cursor_query_param in params
+            or self.page_size_query_param in params
+        )
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, view):
+        return tuple(getattr(view, 'pagination_ordering', self.ordering))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+        return self._set_page(list(self._page_queryset(queryset, request, view)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+        return self._set_page([row async for row in self._page_queryset(queryset, request, view)])
+
+    def _page_queryset(self, queryset, request, view):
+        self.request = request
+        self.ordering_fields = self.get_ordering(view)
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*(self._order_expression(field) for field in self.ordering_fields))
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded:
+            queryset = queryset.filter(self._after(self.decode_cursor(encoded, queryset.model)))
+        # One extra row tells us whether there is a next page
+        return queryset[:self.page_size + 1]
+
+    def paginate_columns(self, queryset, request, column, ordering, values=None):
+        """
+        Page each group of rows sharing a `column` value at once, for boards.
+
+        One query ranks every group on `ordering` (which, like
+        `pagination_ordering`, must end with a unique column) with window
+        functions, keeps the first page_size + 1 rows of each and carries the
+        group's total row count. Returns a list of
+        (value, count, rows, next_link), in `values` order when given (empty
+        groups included), otherwise ordered by value.
+
+        A next link pages its group alone: it narrows the request to
+        ?<column>=<value> and adds a cursor, which is only accepted when
+        `values` holds a single value. Counts stay group totals on every page.
+        """
+        self.request = request
+        self.ordering_fields = tuple(ordering)
+        self.page_size = self.get_page_size(request)
+        partition = [F(column)]
+
+        if values is not None:
+            queryset = queryset.filter(**{f'{column}__in': values})
+        queryset = queryset.annotate(
+            column_value=F(column),
+            column_count=Window(Count('pk'), partition_by=partition),
+            column_rank=Window(
+                RowNumber(), partition_by=partition,
+                order_by=[self._order_expression(field) for field in self.ordering_fields],
+            ),
+        )
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded:
+            if values is None or len(values) != 1:
+                raise ValidationError({self.cursor_query_param: f'A cursor pages a single {column}'})
+            # Rows up to the cursor, counted in the same pass as the totals
+            skipped = Window(
+                Count('pk', filter=~self._after(self.decode_cursor(encoded, queryset.model))), partition_by=partition,
+            )
+            queryset = queryset.annotate(column_page_rank=F('column_rank') - skipped)
+        else:
+            queryset = queryset.annotate(column_page_rank=F('column_rank'))
+        queryset = queryset.filter(column_page_rank__gt=0, column_page_rank__lte=self.page_size + 1)
+
+        groups = {value: [] for value in values or ()}
+        counts = {}
+        for row in queryset.order_by(column, 'column_rank'):
+            groups.setdefault(row.column_value, []).append(row)
+            counts[row.column_value] = row.column_count
+
+        columns = []
+        for value, rows in groups.items():
+            self._set_page(rows)
+            next_link = self.get_next_link()
+            if next_link:
+                next_link = replace_query_param(next_link, column, value)
+            columns.append((value, counts.get(value, 0), self.page, next_link))
+        return columns
+
+    def _set_page(self, rows):
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        values = [self._key_value(last, field) for field in self.ordering_fields]
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(values))
+
+    def encode_cursor(self, values):
+        raw = json.dumps([None if value is None else str(value) for value in values])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, encoded, model):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering_fields):
+            raise NotFound(self.invalid_cursor_message)
+        # Typed like their columns, so a tampered value is a 404 rather than a database error
+        try:
+            return [
+                None if value is None else self._model_field(model, field).to_python(value)
+                for field, value in zip(self.ordering_fields, values)
+            ]
+        except (DjangoValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _model_field(self, model, field):
+        *relations, name = self._field_name(field).split('__')
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        return model._meta.get_field(name)
+
+    @staticmethod
+    def _field_name(field):
+        return field.lstrip('-')
+
+    def _order_expression(self, field):
+        # NULLs always sort last so nullable keys (e.g. Task.due_date) page predictably
+        name = self._field_name(field)
+        if field.startswith('-'):
+            return F(name).desc(nulls_last=True)
+        return F(name).asc(nulls_last=True)
+
+    def _key_value(self, obj, field):
+        value = obj
+        for part in self._field_name(field).split('__'):
+            value = getattr(value, part)
+        return value
+
+    def _after(self, values):
+        """
+        Build `(k1, k2, ...) > (v1, v2, ...)` for the configured directions,
+        i.e. k1 after v1 OR (k1 = v1 AND (k2 after v2 OR (...))).
+        """
+        condition = Q(pk__in=[])
+        for field, value in reversed(list(zip(self.ordering_fields, values))):
+            name = self._field_name(field)
+            if value is None:
+                # Nothing sorts after NULL within this key
+                after, equal = Q(pk__in=[]), Q(**{f'{name}__isnull': True})
+            else:
+                lookup = 'lt' if field.startswith('-') else 'gt'
+                after = Q(**{f'{name}__{lookup}': value}) | Q(**{f'{name}__isnull': True})
+                equal = Q(**{name: value})
+            condition = after | (equal & condition)
+        return condition
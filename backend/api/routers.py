@@ -0,0 +1,77 @@
+"""
+Primary / read-replica routing.
+
+DatabaseRoutingMiddleware (api.middleware) gives every request a
+RoutingState. Views opt in to replica reads once the request is
+authenticated (ReplicaReadMixin in api.views), unless the user wrote within
+the last REPLICA_PIN_SECONDS (read-your-writes). The first write in a
+request sends the rest of it to the primary. Writes, and everything outside
+a request (commands, job workers), use the primary.
+"""
+import contextvars
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+
+@dataclass
+class RoutingState:
+    use_replica: bool = False
+    wrote: bool = False
+
+
+routing_state = contextvars.ContextVar('api_db_routing', default=None)
+
+
+def replica_alias():
+    """The replica's alias when replica reads are enabled, else None."""
+    if not getattr(settings, 'DATABASE_REPLICA_ENABLED', False):
+        return None
+    return getattr(settings, 'DATABASE_REPLICA_ALIAS', 'replica')
+
+
+def pin_cache_key(user_id):
+    return f'db-primary-pin:{user_id}'
+
+
+def pin_to_primary(user_id):
+    cache.set(pin_cache_key(user_id), True, getattr(settings, 'REPLICA_PIN_SECONDS', 10))
+
+
+def route_reads_to_replica(user):
+    """Send the current request's remaining reads to the replica, if allowed."""
+    state = routing_state.get()
+    if state is None or state.wrote or replica_alias() is None:
+        return False
+    if user.is_authenticated and cache.get(pin_cache_key(user.pk)):
+        return False
+    state.use_replica = True
+    return True
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = routing_state.get()
+        if state is not None and state.use_replica and not state.wrote:
+            return replica_alias()
+        return None
+
+    def db_for_write(self, model, **hints):
+        state = routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        aliases = {DEFAULT_DB_ALIAS, getattr(settings, 'DATABASE_REPLICA_ALIAS', 'replica')}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == getattr(settings, 'DATABASE_REPLICA_ALIAS', 'replica'):
+            return False
+        return None
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from .models import Profile, WeddingProject, Event, Task, EventChecklist, FileSubmission, TeamMemberContact, UserPreference
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError as DjangoValidationError
 
 class UserSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True)
@@ -61,6 +62,70 @@ class RegisterSerializer(serializers.Serializer):
 
 
 
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves primary keys against objects preloaded into the serializer
+    context (`prefetched_related[field_name]`, a {pk: obj} dict) when bulk
+    endpoints supply them, instead of one query per row.
+    """
+    def to_internal_value(self, data):
+        prefetched = self.context.get('prefetched_related', {}).get(self.field_name)
+        if prefetched is None:
+            return super().to_internal_value(data)
+        try:
+            pk = self.get_queryset().model._meta.pk.to_python(data)
+        except (TypeError, ValueError, DjangoValidationError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            return prefetched[pk]
+        except KeyError:
+            self.fail('does_not_exist', pk_value=data)
+
+
+def get_sparse_fieldset(request):
+    """
+    Parse ?fields=a,b and ?expand=x,y from a read request.
+    Returns (fields, expand); each is None when the parameter was not sent.
+    """
+    if request is None or request.method != 'GET':
+        return None, None
+
+    def split(param):
+        value = request.query_params.get(param)
+        if value is None:
+            return None
+        return {name.strip() for name in value.split(',') if name.strip()}
+
+    return split('fields'), split('expand')
+
+
+class SparseFieldsMixin:
+    """
+    Sparse fieldsets for read requests.
+
+    Without ?fields= or ?expand= the full representation is returned. Once
+    either is sent, only the requested fields are rendered and nested
+    representations listed in `expandable_fields` are included only when
+    named in ?expand=.
+    """
+    expandable_fields = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields, expand = get_sparse_fieldset(self.context.get('request'))
+        if fields is None and expand is None:
+            return
+
+        expand = expand or set()
+        for name in list(self.fields):
+            if name in self.expandable_fields:
+                keep = name in expand
+            else:
+                keep = fields is None or name in fields
+            if not keep:
+                self.fields.pop(name)
+
+
 class ProfileSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
     class Meta:
@@ -70,22 +135,44 @@ class ProfileSerializer(serializers.ModelSerializer):
 class WeddingProjectSerializer(serializers.ModelSerializer):
     class Meta:
         model = WeddingProject
-        fields = '__all__'
+        exclude = ['search_vector']
         extra_kwargs = {'user': {'read_only': True}}
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     project_details = WeddingProjectSerializer(source='project', read_only=True)
+    expandable_fields = ('project_details',)
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+
     class Meta:
         model = Event
-        fields = '__all__'
+        exclude = ['search_vector']
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     project_details = WeddingProjectSerializer(source='project', read_only=True)
+    expandable_fields = ('project_details',)
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+
     class Meta:
         model = Task
-        fields = '__all__'
+        exclude = ['search_vector']
+
+    def validate(self, data):
+        project = data.get('project', getattr(self.instance, 'project', None))
+        assignee = data.get('assignee')
+        if assignee is not None and project is not None and assignee.owner_id != project.user_id:
+            raise serializers.ValidationError({"assignee": "Assignee must be a team member of the project's studio"})
+        return data
+
+class TaskMoveSerializer(serializers.Serializer):
+    """One card of a board move: the task, its new status column and position in it."""
+    id = serializers.UUIDField()
+    status = serializers.CharField()
+    # Task.position is a Postgres integer column
+    position = serializers.IntegerField(min_value=0, max_value=2**31 - 1)
 
 class EventChecklistSerializer(serializers.ModelSerializer):
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+
     class Meta:
         model = EventChecklist
         fields = '__all__'
@@ -95,12 +182,25 @@ class FileSubmissionSerializer(serializers.ModelSerializer):
         model = FileSubmission
         fields = '__all__'
 
+class ProjectEventSerializer(EventSerializer):
+    """Event nested under its project: no project_details, children inlined."""
+    project_details = None
+    checklists = EventChecklistSerializer(many=True, read_only=True)
+    submissions = FileSubmissionSerializer(many=True, read_only=True)
+
+class ProjectTaskSerializer(TaskSerializer):
+    project_details = None
+
+class WeddingProjectFullSerializer(WeddingProjectSerializer):
+    events = ProjectEventSerializer(many=True, read_only=True)
+    tasks = ProjectTaskSerializer(many=True, read_only=True)
+
 class TeamMemberContactSerializer(serializers.ModelSerializer):
     owner = serializers.PrimaryKeyRelatedField(read_only=True)
     
     class Meta:
         model = TeamMemberContact
-        fields = '__all__'
+        exclude = ['search_vector']
 
 class UserPreferenceSerializer(serializers.ModelSerializer):
     class Meta:
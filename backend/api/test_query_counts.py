@@ -0,0 +1,397 @@
+"""
+Query-count budgets for every api endpoint.
+
+Each endpoint is called once with a single row of every kind of data and
+again after seeding 99 more (or with a 100-item payload for bulk writes).
+The query count must be identical, so an N+1 such as dropping
+`select_related('project')` from EventViewSet fails, and must not exceed the
+endpoint's budget. Failures print the captured SQL.
+
+Every method a route allows must be given a budget: test_every_route_has_a_budget
+lists the (route, method) pairs that have none.
+"""
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from . import urls
+from .models import (
+    Event, EventChecklist, FileSubmission, StudioActivity, Task, TeamMemberContact, UserPreference,
+    WeddingProject, sync_event_assignments,
+)
+
+# (url name, 'get') -> maximum queries for a read
+READ_BUDGETS = {
+    ('profile-list', 'get'): 2,
+    ('profile-detail', 'get'): 2,
+    ('project-list', 'get'): 3,
+    ('project-detail', 'get'): 2,
+    ('project-full', 'get'): 7,
+    ('event-list', 'get'): 3,
+    ('event-detail', 'get'): 2,
+    ('task-list', 'get'): 4,
+    ('task-detail', 'get'): 3,
+    ('task-board', 'get'): 4,
+    ('checklist-list', 'get'): 3,
+    ('checklist-detail', 'get'): 2,
+    ('submission-list', 'get'): 3,
+    ('submission-detail', 'get'): 2,
+    ('contact-list', 'get'): 2,
+    ('contact-detail', 'get'): 1,
+    ('contact-check-invitation', 'get'): 1,
+    ('preference-list', 'get'): 1,
+    ('preference-detail', 'get'): 1,
+    ('dashboard-stats', 'get'): 2,
+    ('calendar', 'get'): 1,
+    ('search', 'get'): 3,
+    ('async-event-list', 'get'): 3,
+    ('async-task-list', 'get'): 4,
+    ('async-dashboard-stats', 'get'): 2,
+}
+
+# (url name, method) -> maximum queries for a write; list endpoints (bulk, move) are sent 1 and 100 items
+WRITE_BUDGETS = {
+    ('profile-detail', 'put'): 4,
+    ('profile-detail', 'patch'): 4,
+    ('profile-detail', 'delete'): 2,
+    ('project-list', 'post'): 3,
+    ('project-detail', 'put'): 2,
+    ('project-detail', 'patch'): 3,
+    ('project-detail', 'delete'): 6,
+    ('event-list', 'post'): 5,
+    ('event-detail', 'put'): 7,
+    ('event-detail', 'patch'): 6,
+    ('event-detail', 'delete'): 6,
+    ('task-list', 'post'): 4,
+    ('task-detail', 'put'): 6,
+    ('task-detail', 'patch'): 5,
+    ('task-detail', 'delete'): 4,
+    ('checklist-list', 'post'): 2,
+    ('checklist-detail', 'put'): 4,
+    ('checklist-detail', 'patch'): 3,
+    ('checklist-detail', 'delete'): 3,
+    ('submission-list', 'post'): 2,
+    ('submission-detail', 'put'): 3,
+    ('submission-detail', 'patch'): 3,
+    ('submission-detail', 'delete'): 3,
+    ('contact-list', 'post'): 16,
+    ('contact-detail', 'put'): 6,
+    ('contact-detail', 'patch'): 4,
+    ('contact-detail', 'delete'): 6,
+    ('preference-list', 'post'): 1,
+    ('preference-detail', 'put'): 2,
+    ('preference-detail', 'patch'): 2,
+    ('preference-detail', 'delete'): 2,
+    ('event-bulk', 'post'): 8,
+    ('event-bulk', 'patch'): 8,
+    ('event-bulk', 'delete'): 9,
+    ('task-bulk', 'post'): 7,
+    ('task-bulk', 'patch'): 7,
+    ('task-bulk', 'delete'): 6,
+    ('task-move', 'post'): 6,
+    ('checklist-bulk', 'post'): 5,
+    ('checklist-bulk', 'patch'): 5,
+    ('checklist-bulk', 'delete'): 5,
+    ('contact-bulk', 'post'): 12,
+    ('contact-resend-invitation', 'post'): 9,
+    ('contact-reset-password', 'post'): 7,
+    ('contact-accept-invitation', 'post'): 7,
+    ('register', 'post'): 8,
+    ('login', 'post'): 5,
+}
+
+# (url name, method) -> why a method the route allows has no budget
+UNBUDGETED = {
+    ('profile-list', 'post'): "profiles are created with their user; the serializer has no user to save one for",
+}
+
+ROWS = 100
+
+
+def format_queries(queries):
+    return '\n'.join(f'  {n}. {query["sql"]}' for n, query in enumerate(queries, 1))
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class QueryBudgetTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="budget", email="budget@example.com", password="TestPass123!")
+        self.owner.profile.role = "admin"
+        self.owner.profile.save()
+        self.project = WeddingProject.objects.create(
+            user=self.owner, couple_name="Ada & Bo", event_date="2026-07-01",
+            event_type="Wedding", location="Nairobi", service_type="Photo",
+        )
+        self.created = 0
+        self.seed(1)
+        self.event = self.project.events.order_by('event_name').first()
+        self.task = self.project.tasks.first()
+        self.checklist = EventChecklist.objects.get(event=self.event)
+        self.submission = FileSubmission.objects.get(event=self.event)
+        self.contact = TeamMemberContact.objects.filter(owner=self.owner).first()
+        self.preference = UserPreference.objects.filter(user=self.owner).first()
+
+    def seed(self, count):
+        """Add `count` rows of every kind of data the endpoints read, each with its own related rows."""
+        numbers = range(self.created, self.created + count)
+        self.created += count
+        contacts = TeamMemberContact.objects.bulk_create(
+            TeamMemberContact(owner=self.owner, name=f"Crew {n}", role="Photographer", email=f"crew{n}@example.com")
+            for n in numbers
+        )
+        User.objects.bulk_create(User(username=f"crew{n}", email=f"crew{n}@example.com") for n in numbers)
+        projects = WeddingProject.objects.bulk_create(
+            WeddingProject(user=self.owner, couple_name=f"Couple {n}", event_date="2026-07-01",
+                           event_type="Wedding", location="Nairobi", service_type="Photo")
+            for n in numbers
+        )
+        # Events and tasks of the main project (for `full`) and of one new project each
+        events = Event.objects.bulk_create(
+            Event(project=project, event_name=f"Event {n:03d}", event_date="2026-07-01", photographer=contact.name)
+            for n, contact, new_project in zip(numbers, contacts, projects)
+            for project in (self.project, new_project)
+        )
+        sync_event_assignments(events)
+        Task.objects.bulk_create(
+            Task(project=project, title=f"Task {n}", assigned_to=contact.name, assignee=contact, due_date="2026-07-02")
+            for n, contact, new_project in zip(numbers, contacts, projects)
+            for project in (self.project, new_project)
+        )
+        EventChecklist.objects.bulk_create(EventChecklist(event=event, item_name="Batteries", category="gear") for event in events)
+        FileSubmission.objects.bulk_create(
+            FileSubmission(event=event, team_member_name="Crew", team_member_role="Photographer",
+                           file_name="a.jpg", file_url="https://files.example.com/a.jpg",
+                           file_type="image", submission_type="raw")
+            for event in events
+        )
+        UserPreference.objects.bulk_create(UserPreference(user=self.owner) for _ in numbers)
+        StudioActivity.objects.bulk_create(
+            StudioActivity(owner=self.owner, action="Project created", details=f"Couple {n}") for n in numbers
+        )
+
+    def run_request(self, method, path, data=None, user=None):
+        # A fresh user each time, so nothing (e.g. user.profile) is cached between calls
+        self.client.force_authenticate(user=User.objects.get(pk=(user or self.owner).pk))
+        with CaptureQueriesContext(connection) as ctx:
+            response = getattr(self.client, method)(path, data, format="json")
+        self.assertLess(response.status_code, 400, f"{method.upper()} {path} -> {response.status_code}: {response.data}")
+        return ctx.captured_queries
+
+    def assertQueriesWithinBudget(self, label, one, many, budget):
+        if len(many) != len(one):
+            self.fail(
+                f"{label} ran {len(one)} queries for 1 row but {len(many)} for {ROWS}\n"
+                f"With 1 row:\n{format_queries(one)}\nWith {ROWS} rows:\n{format_queries(many)}"
+            )
+        if len(many) > budget:
+            self.fail(f"{label} ran {len(many)} queries, over its budget of {budget}:\n{format_queries(many)}")
+
+    def read_paths(self):
+        today = date(2026, 7, 1)
+        return {
+            'profile-list': reverse('profile-list'),
+            'profile-detail': reverse('profile-detail', args=[self.owner.profile.pk]),
+            'project-list': reverse('project-list'),
+            'project-detail': reverse('project-detail', args=[self.project.pk]),
+            'project-full': reverse('project-full', args=[self.project.pk]),
+            'event-list': reverse('event-list'),
+            'event-detail': reverse('event-detail', args=[self.event.pk]),
+            'task-list': reverse('task-list'),
+            'task-detail': reverse('task-detail', args=[self.task.pk]),
+            'task-board': reverse('task-board'),
+            'checklist-list': reverse('checklist-list'),
+            'checklist-detail': reverse('checklist-detail', args=[self.checklist.pk]),
+            'submission-list': reverse('submission-list'),
+            'submission-detail': reverse('submission-detail', args=[self.submission.pk]),
+            'contact-list': reverse('contact-list'),
+            'contact-detail': reverse('contact-detail', args=[self.contact.pk]),
+            'contact-check-invitation': f"{reverse('contact-check-invitation')}?token={self.contact.invitation_token}",
+            'preference-list': reverse('preference-list'),
+            'preference-detail': reverse('preference-detail', args=[self.preference.pk]),
+            'dashboard-stats': reverse('dashboard-stats'),
+            'calendar': f"{reverse('calendar')}?from={today}&to={today + timedelta(days=30)}",
+            'search': f"{reverse('search')}?q=crew",
+            'async-event-list': reverse('async-event-list'),
+            'async-task-list': reverse('async-task-list'),
+            'async-dashboard-stats': reverse('async-dashboard-stats'),
+        }
+
+    def test_reads_do_not_grow_with_the_data(self):
+        paths = self.read_paths()
+        one = {}
+        for name, path in paths.items():
+            with self.subTest(name):
+                one[name] = self.run_request('get', path)
+        self.seed(ROWS - 1)
+        for name, path in paths.items():
+            if name not in one:
+                continue
+            with self.subTest(name):
+                self.assertQueriesWithinBudget(f"GET {path}", one[name], self.run_request('get', path), READ_BUDGETS[name, 'get'])
+
+    def bulk_payloads(self, name, method, count):
+        """`count` items for a list write (bulk or move) to `name`, created fresh so each call has its own rows."""
+        self.seed(count)
+        if name == 'task-move':
+            pks = Task.objects.order_by('-created_at').values_list('pk', flat=True)[:count]
+            return [{"id": str(pk), "status": "editing", "position": n} for n, pk in enumerate(pks)]
+        if method == 'post':
+            if name == 'event-bulk':
+                return [{"project": str(self.project.pk), "event_name": f"New {n}", "event_date": "2026-07-03",
+                         "photographer": "Crew 0"} for n in range(count)]
+            if name == 'task-bulk':
+                return [{"project": str(self.project.pk), "title": f"New {n}", "assigned_to": "Crew 0"} for n in range(count)]
+            if name == 'checklist-bulk':
+                return [{"event": str(self.event.pk), "item_name": f"New {n}", "category": "gear"} for n in range(count)]
+            return [{"name": f"Roster {self.created}-{n}", "role": "Editor", "email": f"roster{self.created}-{n}@example.com"}
+                    for n in range(count)]
+        model = {'event-bulk': Event, 'task-bulk': Task, 'checklist-bulk': EventChecklist}[name]
+        pks = [str(pk) for pk in model.objects.order_by('-created_at').values_list('pk', flat=True)[:count]]
+        if method == 'delete':
+            return pks
+        field = {'event-bulk': 'photographer', 'task-bulk': 'assigned_to', 'checklist-bulk': 'item_name'}[name]
+        return [{"id": pk, field: "Crew 1"} for pk in pks]
+
+    def test_bulk_writes_do_not_grow_with_the_batch(self):
+        single_writes = self.single_writes()
+        for (name, method), budget in WRITE_BUDGETS.items():
+            if (name, method) in single_writes:
+                continue
+            with self.subTest(f"{method.upper()} {name}"):
+                path = reverse(name)
+                one = self.run_request(method, path, self.bulk_payloads(name, method, 1))
+                many = self.run_request(method, path, self.bulk_payloads(name, method, ROWS))
+                self.assertQueriesWithinBudget(f"{method.upper()} {path}", one, many, budget)
+
+    def single_writes(self):
+        """
+        (url name, method) -> a function that prepares one call and returns its
+        (path, data, user), user None being the owner. Detail writes get a fresh
+        row on every call, so both calls make the same change.
+        """
+        def login():
+            # Login creates the token on first use
+            Token.objects.filter(user=self.owner).delete()
+            return reverse('login'), {"username": "budget", "password": "TestPass123!"}, None
+
+        def accept_invitation():
+            # resend_invitation rotates the token
+            token = TeamMemberContact.objects.get(pk=self.contact.pk).invitation_token
+            return reverse('contact-accept-invitation'), {"token": str(token)}, None
+
+        def delete_profile():
+            user = User.objects.create_user(username=f"leaver{self.next_number()}")
+            return reverse('profile-detail', args=[user.profile.pk]), None, user
+
+        project = {"couple_name": "New couple", "event_date": "2026-08-01", "event_type": "Wedding",
+                   "location": "Nairobi", "service_type": "Photo"}
+        event = {"project": str(self.project.pk), "event_name": "New event", "event_date": "2026-07-03",
+                 "photographer": "Crew 0"}
+        task = {"project": str(self.project.pk), "title": "New task", "assigned_to": "Crew 0"}
+        checklist = {"event": str(self.event.pk), "item_name": "Lens cloth", "category": "gear"}
+        submission = {"event": str(self.event.pk), "team_member_name": "Crew", "team_member_role": "Photographer",
+                      "file_name": "b.jpg", "file_url": "https://files.example.com/b.jpg",
+                      "file_type": "image", "submission_type": "raw"}
+        return {
+            ('profile-detail', 'put'): lambda: (
+                reverse('profile-detail', args=[self.owner.profile.pk]), {"role": "admin", "full_name": f"Owner {self.next_number()}"},
+                None,
+            ),
+            ('profile-detail', 'patch'): lambda: (
+                reverse('profile-detail', args=[self.owner.profile.pk]), {"company_name": f"Studio {self.next_number()}"}, None,
+            ),
+            ('profile-detail', 'delete'): delete_profile,
+            **self.model_writes(
+                'project', lambda: WeddingProject.objects.create(user=self.owner, **project),
+                lambda: project, {"location": "Mombasa"},
+            ),
+            **self.model_writes(
+                'event', lambda: Event.objects.create(project=self.project, event_name="Old event", event_date="2026-07-02"),
+                lambda: event, {"photographer": "Crew 0"},
+            ),
+            **self.model_writes(
+                'task', lambda: Task.objects.create(project=self.project, title="Old task"),
+                lambda: task, {"assigned_to": "Crew 0"},
+            ),
+            **self.model_writes(
+                'checklist', lambda: EventChecklist.objects.create(event=self.event, item_name="Tripod", category="gear"),
+                lambda: checklist, {"is_completed": True},
+            ),
+            **self.model_writes(
+                'submission', lambda: FileSubmission.objects.create(**{**submission, "event": self.event}),
+                lambda: submission, {"review_status": "approved"},
+            ),
+            **self.model_writes(
+                'contact', lambda: TeamMemberContact.objects.create(owner=self.owner, **self.contact_payload()),
+                self.contact_payload, {"role": "Editor"},
+            ),
+            **self.model_writes(
+                'preference', lambda: UserPreference.objects.create(user=self.owner),
+                lambda: {"theme": "dark"}, {"language": "sw"},
+            ),
+            ('contact-resend-invitation', 'post'): lambda: (
+                reverse('contact-resend-invitation', args=[self.contact.pk]), None, None,
+            ),
+            ('contact-reset-password', 'post'): lambda: (
+                reverse('contact-reset-password', args=[self.contact.pk]), None, None,
+            ),
+            ('contact-accept-invitation', 'post'): accept_invitation,
+            ('register', 'post'): lambda: (reverse('register'), self.register_payload(), None),
+            ('login', 'post'): login,
+        }
+
+    def model_writes(self, basename, fresh, payload, change):
+        """POST, PUT, PATCH and DELETE calls of a model viewset; `fresh` makes the row a detail call writes to."""
+        def detail():
+            return reverse(f'{basename}-detail', args=[fresh().pk])
+
+        return {
+            (f'{basename}-list', 'post'): lambda: (reverse(f'{basename}-list'), payload(), None),
+            (f'{basename}-detail', 'put'): lambda: (detail(), payload(), None),
+            (f'{basename}-detail', 'patch'): lambda: (detail(), change, None),
+            (f'{basename}-detail', 'delete'): lambda: (detail(), None, None),
+        }
+
+    def next_number(self):
+        self.created += 1
+        return self.created
+
+    def register_payload(self):
+        n = self.next_number()
+        return {"username": f"new{n}", "email": f"new{n}@example.com", "password": "TestPass123!"}
+
+    def contact_payload(self):
+        n = self.next_number()
+        return {"name": f"Joiner {n}", "role": "Photographer", "email": f"joiner{n}@example.com"}
+
+    def test_single_writes_do_not_grow_with_the_data(self):
+        writes = self.single_writes()
+        one = {key: self.run_request(key[1], *write()) for key, write in writes.items()}
+        self.seed(ROWS - 1)
+        for key, write in writes.items():
+            with self.subTest(f"{key[1].upper()} {key[0]}"):
+                path, data, user = write()
+                self.assertQueriesWithinBudget(
+                    f"{key[1].upper()} {path}", one[key], self.run_request(key[1], path, data, user), WRITE_BUDGETS[key],
+                )
+
+    def test_every_route_has_a_budget(self):
+        routes = set()
+        for prefix, viewset, basename in urls.router.registry:
+            for route in urls.router.get_routes(viewset):
+                name = route.name.format(basename=basename)
+                routes |= {(name, method) for method in urls.router.get_method_map(viewset, route.mapping)}
+        for pattern in urls.urlpatterns:
+            if isinstance(pattern, URLPattern) and pattern.name:
+                view = pattern.callback.view_class
+                routes |= {(pattern.name, method) for method in view.http_method_names
+                           if method not in ('head', 'options') and hasattr(view, method)}
+
+        budgeted = set(READ_BUDGETS) | set(WRITE_BUDGETS) | set(UNBUDGETED)
+        self.assertEqual(sorted(routes - budgeted), [])
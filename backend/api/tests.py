@@ -1,8 +1,47 @@
+import _thread
+import datetime
+import decimal
+import json
+import signal
+import threading
+import time
+import uuid
+from importlib import import_module
+from io import BytesIO, StringIO
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.apps import apps
 from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management import CommandError, call_command
+from django.db import connection, connections
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase, APITransactionTestCase
 
-from .models import WeddingProject
+from .jobs import Worker, claim_jobs, enqueue_email
+from .middleware import QueryInstrumentationMiddleware, query_shape
+from .models import (
+    Event, EventAssignment, EventChecklist, FileSubmission, Job, StudioStats, Task, TeamAccess,
+    TeamMemberContact, WeddingProject,
+)
+from .pagination import KeysetPagination
+from .renderers import ORJSONParser, ORJSONRenderer
+from .views import (
+    find_login_user,
+    EventChecklistViewSet, EventViewSet, FileSubmissionViewSet,
+    TaskViewSet, TeamMemberContactViewSet, WeddingProjectViewSet,
+)
 
 
 class AuthSmokeTests(APITestCase):
@@ -25,6 +64,22 @@ class AuthSmokeTests(APITestCase):
         self.assertIn("token", response.data)
         self.assertEqual(response.data["email"], self.user.email)
 
+    def test_login_with_email_is_case_insensitive(self):
+        response = self.client.post(
+            "/api/login/",
+            {"username": "OWNER@Example.com", "password": self.password},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["user_id"], self.user.pk)
+
+    def test_username_match_wins_over_email_match(self):
+        other = User.objects.create_user(username="owner@example.com", email="x@example.com")
+
+        self.assertEqual(find_login_user("Owner@example.com"), other)
+        self.assertEqual(find_login_user("OWNER"), self.user)
+
     def test_login_rejects_invalid_credentials(self):
         response = self.client.post(
             "/api/login/",
@@ -34,6 +89,12 @@ class AuthSmokeTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_login_with_a_non_string_identifier_is_not_found(self):
+        response = self.client.post("/api/login/", {"username": 123, "password": self.password}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"], "User not found with this email")
+
 
 class ProjectPermissionsSmokeTests(APITestCase):
     def setUp(self):
@@ -80,3 +141,1598 @@ class ProjectPermissionsSmokeTests(APITestCase):
         response = self.client.get("/api/projects/")
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class TeamAccessTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="studio",
+            email="studio@example.com",
+            password="TestPass123!",
+        )
+        self.member = User.objects.create_user(
+            username="crew",
+            email="crew@example.com",
+            password="TestPass123!",
+        )
+        self.project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Eve & Frank",
+            event_date="2026-09-01",
+            event_type="Wedding",
+            location="Kisumu",
+            service_type="Photo",
+        )
+
+    def add_contact(self, email="crew@example.com", status="joined"):
+        return TeamMemberContact.objects.create(
+            owner=self.owner, name="Crew", role="Photographer", email=email, status=status
+        )
+
+    def test_joined_member_sees_owner_projects(self):
+        self.add_contact()
+        self.client.force_authenticate(user=self.member)
+
+        response = self.client.get("/api/projects/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["id"] for row in response.data], [str(self.project.id)])
+
+    def test_access_follows_contact_status_and_deletion(self):
+        contact = self.add_contact(status="pending")
+        self.assertFalse(TeamAccess.objects.filter(member=self.member).exists())
+
+        contact.status = "sent"
+        contact.save()
+        self.assertTrue(TeamAccess.objects.filter(member=self.member, owner=self.owner).exists())
+
+        contact.email = "someone-else@example.com"
+        contact.save()
+        self.assertFalse(TeamAccess.objects.filter(member=self.member).exists())
+
+        contact.email = "crew@example.com"
+        contact.save()
+        contact.delete()
+        self.assertFalse(TeamAccess.objects.filter(member=self.member).exists())
+
+    def test_member_signing_up_after_invite_gets_access(self):
+        self.add_contact(email="late@example.com", status="sent")
+
+        late = User.objects.create_user(username="late", email="late@example.com", password="TestPass123!")
+
+        self.assertTrue(TeamAccess.objects.filter(member=late, owner=self.owner).exists())
+
+    def test_list_queries_do_not_use_distinct(self):
+        self.add_contact()
+        self.client.force_authenticate(user=self.member)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get("/api/events/")
+
+        self.assertFalse(any("DISTINCT" in query["sql"] for query in ctx.captured_queries))
+
+
+class KeysetPaginationTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="pager",
+            email="pager@example.com",
+            password="TestPass123!",
+        )
+        self.owner.profile.role = "admin"
+        self.owner.profile.save()
+        self.project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Gina & Hal",
+            event_date="2026-05-01",
+            event_type="Wedding",
+            location="Nakuru",
+            service_type="Photo",
+        )
+        # Tasks share due dates (and some have none) so ties must break on id
+        for n in range(7):
+            Task.objects.create(
+                project=self.project,
+                title=f"Task {n}",
+                due_date=None if n % 3 == 0 else f"2026-05-0{n % 2 + 1}",
+            )
+        self.client.force_authenticate(user=self.owner)
+
+    def test_unpaginated_by_default(self):
+        response = self.client.get("/api/tasks/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 7)
+
+    def test_walks_all_pages_in_key_order(self):
+        seen = []
+        url = "/api/tasks/?page_size=3"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 3)
+            seen.extend(response.data["results"])
+            url = response.data["next"]
+
+        expected = sorted(
+            Task.objects.all(), key=lambda t: (t.due_date is None, t.due_date or "", str(t.id))
+        )
+        self.assertEqual([row["id"] for row in seen], [str(t.id) for t in expected])
+
+    @override_settings(API_PAGINATE_BY_DEFAULT=True)
+    def test_compatibility_switch_paginates_every_list(self):
+        response = self.client.get("/api/tasks/")
+
+        self.assertEqual(len(response.data["results"]), 7)
+        self.assertIsNone(response.data["next"])
+
+    def test_invalid_cursor_returns_not_found(self):
+        response = self.client.get("/api/tasks/?cursor=not-a-cursor")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_values_of_the_wrong_type_return_not_found(self):
+        # Tasks page on (due_date, id)
+        for values in (["not-a-date", uuid.uuid4()], ["2026-05-01", "not-a-uuid"], ["2026-02-30", uuid.uuid4()]):
+            with self.subTest(values=values):
+                response = self.client.get("/api/tasks/", {"cursor": KeysetPagination().encode_cursor(values)})
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class SparseFieldsetTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="sparse",
+            email="sparse@example.com",
+            password="TestPass123!",
+        )
+        self.project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Ivy & Jon",
+            event_date="2026-04-01",
+            event_type="Wedding",
+            location="Eldoret",
+            service_type="Photo",
+        )
+        Event.objects.create(
+            project=self.project,
+            event_name="Sangeet",
+            event_date="2026-04-01",
+            details="A very long brief " * 50,
+        )
+        self.client.force_authenticate(user=self.owner)
+
+    def test_full_representation_by_default(self):
+        response = self.client.get("/api/events/")
+
+        self.assertIn("details", response.data[0])
+        self.assertEqual(response.data[0]["project_details"]["couple_name"], "Ivy & Jon")
+
+    def test_fields_limit_output_and_columns(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/events/?fields=id,event_name,event_date")
+
+        self.assertEqual(set(response.data[0]), {"id", "event_name", "event_date"})
+        event_sql = [
+            q["sql"] for q in ctx.captured_queries
+            if 'FROM "api_event"' in q["sql"] and "COUNT(" not in q["sql"]
+        ]
+        self.assertEqual(len(event_sql), 1)
+        self.assertNotIn('"api_event"."details"', event_sql[0])
+        self.assertNotIn('"api_weddingproject"."couple_name"', event_sql[0])
+
+    def test_expand_opts_in_project_details(self):
+        response = self.client.get("/api/events/?fields=id,event_name&expand=project_details")
+
+        self.assertEqual(set(response.data[0]), {"id", "event_name", "project_details"})
+        self.assertEqual(response.data[0]["project_details"]["id"], str(self.project.id))
+
+
+class EventAssignmentTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="crewlead",
+            email="crewlead@example.com",
+            password="TestPass123!",
+        )
+        self.project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Kim & Lee",
+            event_date="2026-03-01",
+            event_type="Wedding",
+            location="Naivasha",
+            service_type="Photo + Video",
+        )
+        self.ann = TeamMemberContact.objects.create(owner=self.owner, name="Ann", role="Photographer")
+        self.event = Event.objects.create(
+            project=self.project,
+            event_name="Ceremony",
+            event_date="2026-03-01",
+            photographer="Ann, Bob",
+            drone_operator="Cy",
+        )
+        self.client.force_authenticate(user=self.owner)
+
+    def test_crew_columns_are_normalized(self):
+        rows = set(self.event.assignments.values_list("role", "member_name", "member_id"))
+
+        self.assertEqual(rows, {
+            ("photographer", "Ann", self.ann.id),
+            ("photographer", "Bob", None),
+            ("drone_operator", "Cy", None),
+        })
+
+        self.event.photographer = "Bob"
+        self.event.save()
+        self.assertEqual(
+            set(self.event.assignments.values_list("member_name", flat=True)), {"Bob", "Cy"}
+        )
+
+    def test_assigned_to_filter_matches_whole_names(self):
+        response = self.client.get("/api/events/?assigned_to=ann")
+        self.assertEqual([row["id"] for row in response.data], [str(self.event.id)])
+        self.assertEqual(response.data[0]["photographer"], "Ann, Bob")
+
+        response = self.client.get("/api/events/?assigned_to=An")
+        self.assertEqual(response.data, [])
+
+        response = self.client.get(f"/api/events/?member_id={self.ann.id}")
+        self.assertEqual(len(response.data), 1)
+
+        for url in ("/api/events/", "/api/async/events/"):
+            response = self.client.get(url, {"member_id": "abc"})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, url)
+            self.assertIn("member_id", response.data)
+
+
+class IndexUsageTests(APITestCase):
+    """
+    EXPLAIN each viewset's main query with sequential scans disabled: if the
+    planner still has to scan the base table, no index covers the filter.
+    """
+
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="indexed",
+            email="indexed@example.com",
+            password="TestPass123!",
+        )
+        self.owner.profile.role = "admin"
+        self.owner.profile.save()
+        self.project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Mia & Ned",
+            event_date="2026-02-01",
+            event_type="Wedding",
+            location="Malindi",
+            service_type="Photo",
+        )
+        self.event = Event.objects.create(project=self.project, event_name="Haldi", event_date="2026-02-01")
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def plan_for(self, viewset_class, url):
+        request = Request(APIRequestFactory().get(url))
+        request.user = self.owner
+        view = viewset_class(request=request, format_kwarg=None, kwargs={})
+        return view.get_queryset().explain()
+
+    def assert_indexed(self, plan, table):
+        self.assertIn("Index", plan)
+        self.assertNotIn(f"Seq Scan on {table}", plan, plan)
+
+    def test_viewset_queries_use_indexes(self):
+        cases = [
+            (WeddingProjectViewSet, "/api/projects/", "api_weddingproject"),
+            (EventViewSet, f"/api/events/?project_id={self.project.id}&start_date=2026-01-01", "api_event"),
+            (EventViewSet, "/api/events/?assigned_to=ann", "api_eventassignment"),
+            (TaskViewSet, f"/api/tasks/?project_id={self.project.id}&end_date=2026-12-31", "api_task"),
+            (EventChecklistViewSet, f"/api/event-checklists/?event_id={self.event.id}", "api_eventchecklist"),
+            (FileSubmissionViewSet, f"/api/submissions/?event_id={self.event.id}&team_member_name=Ann", "api_filesubmission"),
+            (TeamMemberContactViewSet, "/api/contacts/", "api_teammembercontact"),
+        ]
+        for viewset_class, url, table in cases:
+            with self.subTest(url=url):
+                self.assert_indexed(self.plan_for(viewset_class, url), table)
+
+    def test_invitation_and_dashboard_lookups_use_indexes(self):
+        token_plan = TeamMemberContact.objects.filter(invitation_token=uuid.uuid4()).explain()
+        self.assert_indexed(token_plan, "api_teammembercontact")
+
+        active_plan = WeddingProject.objects.filter(user=self.owner, status="active").explain()
+        self.assertIn("project_user_", active_plan)
+
+    def test_login_lookup_uses_lower_indexes(self):
+        with CaptureQueriesContext(connection) as ctx:
+            find_login_user("Indexed@Example.com")
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN " + ctx.captured_queries[0]["sql"])
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        self.assertIn("auth_user_username_lower_idx", plan)
+        self.assertIn("auth_user_email_lower_idx", plan)
+
+    def test_assigned_to_substring_uses_trigram_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            if cursor.fetchone() is None:
+                self.skipTest("pg_trgm is not installed on this server")
+
+        plan = self.plan_for(TaskViewSet, "/api/tasks/?assigned_to=ann")
+        self.assertIn("task_assigned_trgm_idx", plan)
+
+
+class DashboardStatsTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="dash",
+            email="dash@example.com",
+            password="TestPass123!",
+        )
+        self.other = User.objects.create_user(
+            username="otherdash",
+            email="otherdash@example.com",
+            password="TestPass123!",
+        )
+        TeamMemberContact.objects.create(owner=self.other, name="Not mine", role="Editor")
+        self.client.force_authenticate(user=self.owner)
+
+    def create_project(self, name, status="active"):
+        return WeddingProject.objects.create(
+            user=self.owner,
+            couple_name=name,
+            event_date="2026-01-01",
+            event_type="Wedding",
+            location="Lamu",
+            service_type="Photo",
+            status=status,
+        )
+
+    def test_counters_follow_changes_and_are_scoped_to_owner(self):
+        first = self.create_project("Oli & Pam")
+        self.create_project("Quin & Rae", status="completed")
+        contact = TeamMemberContact.objects.create(owner=self.owner, name="Sam", role="Photographer")
+
+        response = self.client.get("/api/dashboard/stats/")
+        self.assertEqual(response.data["active_projects"], 1)
+        self.assertEqual(response.data["team_members"], 1)
+        self.assertEqual(
+            [a["action"] for a in response.data["recent_activity"]],
+            ["Team member invited", "New project created", "New project created"],
+        )
+
+        first.status = "completed"
+        first.save()
+        contact.delete()
+        response = self.client.get("/api/dashboard/stats/")
+        self.assertEqual(response.data["active_projects"], 0)
+        self.assertEqual(response.data["team_members"], 0)
+
+    def test_stats_are_a_constant_number_of_reads(self):
+        for n in range(5):
+            self.create_project(f"Couple {n}")
+        self.client.get("/api/dashboard/stats/")
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get("/api/dashboard/stats/")
+        self.assertEqual(len(ctx.captured_queries), 2)
+
+    def test_rebuild_command_repairs_drift(self):
+        self.create_project("Tia & Uma")
+        StudioStats.objects.filter(owner=self.owner).update(active_projects=42)
+
+        call_command("rebuild_studio_stats", stdout=StringIO())
+
+        self.assertEqual(StudioStats.objects.get(owner=self.owner).active_projects, 1)
+
+
+class BulkEndpointTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="bulk",
+            email="bulk@example.com",
+            password="TestPass123!",
+        )
+        self.owner.profile.role = "admin"
+        self.owner.profile.save()
+        self.project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Vic & Wes",
+            event_date="2026-07-01",
+            event_type="Wedding",
+            location="Diani",
+            service_type="Photo + Video",
+        )
+        self.foreign_project = WeddingProject.objects.create(
+            user=User.objects.create_user(username="stranger", email="stranger@example.com"),
+            couple_name="Not mine",
+            event_date="2026-07-01",
+            event_type="Wedding",
+            location="Diani",
+            service_type="Photo",
+        )
+        self.client.force_authenticate(user=self.owner)
+
+    def event_payload(self, n, project=None):
+        return {
+            "project": str((project or self.project).id),
+            "event_name": f"Event {n}",
+            "event_date": f"2026-07-{n + 1:02d}",
+            "photographer": "Ann",
+        }
+
+    def test_list_payload_creates_events_in_constant_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                "/api/events/", [self.event_payload(n) for n in range(12)], format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 12)
+        self.assertEqual(Event.objects.filter(project=self.project).count(), 12)
+        self.assertEqual(EventAssignment.objects.filter(event__project=self.project).count(), 12)
+        self.assertLessEqual(len(ctx.captured_queries), 10)
+
+    def test_invalid_item_rolls_back_batch_with_per_item_errors(self):
+        payload = [
+            self.event_payload(0),
+            {"project": str(self.project.id), "event_date": "2026-07-02"},
+            self.event_payload(2, project=self.foreign_project),
+        ]
+
+        response = self.client.post("/api/events/bulk/", payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data["errors"]
+        self.assertEqual(errors[0], {})
+        self.assertIn("event_name", errors[1])
+        self.assertIn("project", errors[2])
+        self.assertFalse(Event.objects.exists())
+
+    def test_bulk_update_and_delete(self):
+        tasks = Task.objects.bulk_create(
+            Task(project=self.project, title=f"Task {n}") for n in range(3)
+        )
+
+        response = self.client.patch(
+            "/api/tasks/bulk/",
+            [{"id": str(task.id), "status": "completed"} for task in tasks],
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Task.objects.filter(status="completed").count(), 3)
+
+        response = self.client.delete(
+            "/api/tasks/bulk/", [str(tasks[0].id), str(uuid.uuid4())], format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"][1], {"id": ["Not found."]})
+        self.assertEqual(Task.objects.count(), 3)
+
+        response = self.client.delete(
+            "/api/tasks/bulk/", [str(task.id) for task in tasks[:2]], format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_checklist_toggles_in_one_request(self):
+        event = Event.objects.create(project=self.project, event_name="Mehndi", event_date="2026-07-01")
+        items = EventChecklist.objects.bulk_create(
+            EventChecklist(event=event, item_name=f"Item {n}", category="gear") for n in range(4)
+        )
+
+        response = self.client.patch(
+            "/api/event-checklists/bulk/",
+            [{"id": str(item.id), "is_completed": True} for item in items],
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(EventChecklist.objects.filter(is_completed=True).count(), 4)
+
+
+class ProjectFullEndpointTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="full",
+            email="full@example.com",
+            password="TestPass123!",
+        )
+        self.owner.profile.role = "admin"
+        self.owner.profile.save()
+        self.project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Xan & Yara",
+            event_date="2026-10-01",
+            event_type="Wedding",
+            location="Watamu",
+            service_type="Photo + Video",
+        )
+        self.client.force_authenticate(user=self.owner)
+
+    def add_events(self, count):
+        for n in range(count):
+            event = Event.objects.create(
+                project=self.project, event_name=f"Event {n}", event_date="2026-10-01"
+            )
+            EventChecklist.objects.create(event=event, item_name="Batteries", category="gear")
+            FileSubmission.objects.create(
+                event=event, team_member_name="Ann", team_member_role="Photographer",
+                file_name="raw.zip", file_url="https://example.com/raw.zip",
+                file_type="zip", submission_type="raw",
+            )
+            Task.objects.create(project=self.project, title=f"Cull {n}")
+
+    def fetch(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f"/api/projects/{self.project.id}/full/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(ctx.captured_queries)
+
+    def test_nested_payload(self):
+        self.add_events(2)
+
+        response, _ = self.fetch()
+
+        self.assertEqual(len(response.data["events"]), 2)
+        self.assertEqual(len(response.data["tasks"]), 2)
+        event = response.data["events"][0]
+        self.assertEqual(len(event["checklists"]), 1)
+        self.assertEqual(event["submissions"][0]["file_name"], "raw.zip")
+        self.assertNotIn("project_details", event)
+
+    def test_query_count_does_not_grow_with_events(self):
+        self.add_events(1)
+        _, few = self.fetch()
+
+        self.add_events(9)
+        with self.assertNumQueries(few):
+            self.client.get(f"/api/projects/{self.project.id}/full/")
+
+    def test_other_studios_project_is_not_found(self):
+        stranger = User.objects.create_user(username="nosy", email="nosy@example.com")
+        self.client.force_authenticate(user=stranger)
+
+        response = self.client.get(f"/api/projects/{self.project.id}/full/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="etag",
+            email="etag@example.com",
+            password="TestPass123!",
+        )
+        self.project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Zed & Amy",
+            event_date="2026-11-01",
+            event_type="Wedding",
+            location="Kilifi",
+            service_type="Photo",
+        )
+        self.event = Event.objects.create(project=self.project, event_name="Vows", event_date="2026-11-01")
+        self.client.force_authenticate(user=self.owner)
+
+    def test_unchanged_list_returns_304_without_serializing(self):
+        first = self.client.get("/api/events/")
+        etag = first["ETag"]
+        self.assertIn("Last-Modified", first)
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get("/api/events/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(ctx.captured_queries), 2)  # team access + aggregate
+
+    def test_responses_must_be_revalidated(self):
+        first = self.client.get("/api/events/")
+        not_modified = self.client.get("/api/events/", HTTP_IF_NONE_MATCH=first["ETag"])
+        detail = self.client.get(f"/api/events/{self.event.id}/")
+
+        for response in (first, not_modified, detail):
+            self.assertEqual(set(response["Cache-Control"].split(", ")), {"private", "no-cache"})
+            self.assertIn("Authorization", response["Vary"])
+
+    def test_changes_and_filters_produce_new_etags(self):
+        etag = self.client.get("/api/events/")["ETag"]
+
+        filtered = self.client.get("/api/events/?project_id=" + str(self.project.id), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(filtered.status_code, status.HTTP_200_OK)
+
+        self.project.couple_name = "Zed & Amelia"
+        self.project.save()
+        changed = self.client.get("/api/events/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data[0]["project_details"]["couple_name"], "Zed & Amelia")
+
+    def test_detail_etag(self):
+        url = f"/api/events/{self.event.id}/"
+        etag = self.client.get(url)["ETag"]
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.patch(url, {"event_name": "Vow renewal"}, format="json")
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+    def test_submission_edits_change_etags(self):
+        submission = FileSubmission.objects.create(
+            event=self.event, team_member_name="Crew", team_member_role="Photographer", file_name="a.jpg",
+            file_url="https://files.example.com/a.jpg", file_type="image", submission_type="raw",
+        )
+        urls = ["/api/submissions/", f"/api/submissions/{submission.id}/"]
+        etags = [self.client.get(url)["ETag"] for url in urls]
+
+        self.client.patch(urls[1], {"review_status": "approved"}, format="json")
+
+        for url, etag in zip(urls, etags):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK, url)
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_matches_drf_json_output(self):
+        data = {
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "time": datetime.datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc),
+            "amount": decimal.Decimal("12.50"),
+            "text": "line separator",
+        }
+
+        rendered = ORJSONRenderer().render(data)
+
+        self.assertEqual(json.loads(rendered), json.loads(JSONRenderer().render(data)))
+        self.assertIn(b"\\u2028", rendered)
+
+    def test_parser_round_trip_and_errors(self):
+        parsed = ORJSONParser().parse(BytesIO(b'[{"event_name": "Vows"}]'))
+        self.assertEqual(parsed, [{"event_name": "Vows"}])
+
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(BytesIO(b'{"broken": '))
+
+    def test_falls_back_without_orjson(self):
+        with mock.patch("api.renderers.orjson", None):
+            self.assertEqual(json.loads(ORJSONRenderer().render({"a": 1})), {"a": 1})
+            self.assertEqual(ORJSONParser().parse(BytesIO(b'{"a": 1}')), {"a": 1})
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="cached",
+            email="cached@example.com",
+            password="TestPass123!",
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def token_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/preferences/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [q for q in ctx.captured_queries if '"authtoken_token"' in q["sql"]]
+
+    def test_repeat_calls_skip_token_lookup(self):
+        self.assertEqual(len(self.token_queries()), 1)
+        self.assertEqual(self.token_queries(), [])
+
+    def test_deleted_token_is_rejected(self):
+        self.token_queries()
+        self.token.delete()
+
+        response = self.client.get("/api/preferences/")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivation_and_password_change_invalidate(self):
+        self.token_queries()
+        self.user.set_password("NewPass456!")
+        self.user.save()
+        self.assertEqual(len(self.token_queries()), 1)
+
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get("/api/preferences/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class AsyncReadEndpointTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username="asyncowner",
+            email="asyncowner@example.com",
+            password="TestPass123!",
+        )
+        self.owner.profile.role = "admin"
+        self.owner.profile.save()
+        project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Bo & Cy",
+            event_date="2026-12-01",
+            event_type="Wedding",
+            location="Diani",
+            service_type="Photo",
+        )
+        for day in range(1, 4):
+            Event.objects.create(project=project, event_name=f"Day {day}", event_date=f"2026-12-0{day}")
+            Task.objects.create(project=project, title=f"Task {day}", due_date=f"2026-11-2{day}")
+        token = Token.objects.create(user=self.owner)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.auth = {"Authorization": f"Token {token.key}"}
+
+    def async_get(self, path, headers=None):
+        return async_to_sync(self.async_client.get)(path, headers={**self.auth, **(headers or {})})
+
+    def test_async_reads_match_sync_endpoints(self):
+        for path in ("events/?start_date=2026-12-02", "tasks/", "dashboard/stats/"):
+            expected = self.client.get(f"/api/{path}").json()
+            response = self.async_get(f"/api/async/{path}")
+            self.assertEqual(response.status_code, status.HTTP_200_OK, path)
+            self.assertEqual(response.json(), expected, path)
+
+    def test_async_list_pages_and_answers_conditional_gets(self):
+        first = self.async_get("/api/async/events/?page_size=2&fields=id,event_name")
+        body = first.json()
+        self.assertEqual([e["event_name"] for e in body["results"]], ["Day 1", "Day 2"])
+        self.assertEqual(set(body["results"][0]), {"id", "event_name"})
+
+        second = self.async_get(body["next"])
+        self.assertEqual([e["event_name"] for e in second.json()["results"]], ["Day 3"])
+
+        repeat = self.async_get("/api/async/events/?page_size=2&fields=id,event_name", {"If-None-Match": first["ETag"]})
+        self.assertEqual(repeat.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_async_reads_require_authentication(self):
+        response = async_to_sync(self.async_client.get)("/api/async/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_async_views_stay_on_the_event_loop(self):
+        # With DEBUG on, Django logs each middleware it has to adapt; one
+        # sync-only entry would put every ASGI request, async views included,
+        # on a thread
+        with override_settings(DEBUG=True), self.assertNoLogs("django.request", "DEBUG"):
+            ASGIHandler()
+
+        response = self.async_get("/api/async/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Queries the async view ran through sync_to_async are still recorded
+        self.assertRegex(response["Server-Timing"], r'desc="[1-9]\d* queries"')
+
+
+class CalendarEndpointTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="calendar",
+            email="calendar@example.com",
+            password="TestPass123!",
+        )
+        self.project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Eve & Fin",
+            event_date="2026-03-01",
+            event_type="Wedding",
+            location="Naivasha",
+            service_type="Photo",
+        )
+        Event.objects.create(project=self.project, event_name="Mehndi", event_date="2026-03-02")
+        Event.objects.create(project=self.project, event_name="Wedding week", event_date="2026-03-04", end_date="2026-03-10")
+        Event.objects.create(project=self.project, event_name="Reception", event_date="2026-04-01")
+        stranger = User.objects.create_user(username="calstranger", email="calstranger@example.com")
+        other = WeddingProject.objects.create(
+            user=stranger, couple_name="Not mine", event_date="2026-03-01",
+            event_type="Wedding", location="Nakuru", service_type="Photo",
+        )
+        Event.objects.create(project=other, event_name="Hidden", event_date="2026-03-02")
+        self.client.force_authenticate(user=self.owner)
+
+    def buckets(self, response):
+        return {b["start"]: [e["event_name"] for e in b["events"]] for b in response.data["buckets"]}
+
+    def test_day_buckets_expand_multi_day_events_within_range(self):
+        response = self.client.get("/api/calendar/?from=2026-03-01&to=2026-03-05")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.buckets(response), {
+            datetime.date(2026, 3, 2): ["Mehndi"],
+            datetime.date(2026, 3, 4): ["Wedding week"],
+            datetime.date(2026, 3, 5): ["Wedding week"],
+        })
+        self.assertEqual(response.data["buckets"][0]["events"][0]["couple_name"], "Eve & Fin")
+
+    def test_week_and_month_granularity(self):
+        weeks = self.client.get("/api/calendar/?from=2026-03-01&to=2026-03-31&granularity=week")
+        # Buckets are keyed by the Monday that starts each week
+        self.assertEqual(self.buckets(weeks), {
+            datetime.date(2026, 3, 2): ["Mehndi", "Wedding week"],
+            datetime.date(2026, 3, 9): ["Wedding week"],
+        })
+        self.assertEqual([b["count"] for b in weeks.data["buckets"]], [2, 1])
+
+        months = self.client.get("/api/calendar/?from=2026-01-01&to=2026-12-31&granularity=month")
+        self.assertEqual(
+            [(b["start"], b["count"]) for b in months.data["buckets"]],
+            [(datetime.date(2026, 3, 1), 2), (datetime.date(2026, 4, 1), 1)],
+        )
+
+    def test_month_view_is_one_query(self):
+        with self.assertNumQueries(1):
+            self.client.get("/api/calendar/?from=2026-03-01&to=2026-03-31")
+
+    def test_rejects_bad_parameters(self):
+        for query in ("", "from=2026-03-05&to=2026-03-01", "from=2026-01-01&to=2027-06-01", "from=2026-03-01&to=2026-03-02&granularity=year",
+                      "from=2026-03-01&to=2026-03-02&project_id=abc"):
+            self.assertEqual(self.client.get(f"/api/calendar/?{query}").status_code, status.HTTP_400_BAD_REQUEST, query)
+
+
+class JobQueueTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="mailer",
+            email="mailer@example.com",
+            password="TestPass123!",
+        )
+        self.client.force_authenticate(user=self.owner)
+
+    def queue_emails(self, count):
+        for n in range(count):
+            enqueue_email(f"Hello {n}", "Body", "system@weddingflow.com", [f"crew{n}@example.com"])
+
+    def test_resend_invitation_queues_email_for_workers(self):
+        contact = TeamMemberContact.objects.create(
+            owner=self.owner, name="Ivy", role="Editor", email="ivy@example.com", status="pending",
+        )
+
+        response = self.client.post(f"/api/contacts/{contact.id}/resend_invitation/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(mail.outbox, [])
+        call_command("run_workers", "--workers", "1", "--once", stdout=StringIO())
+        self.assertEqual([m.to for m in mail.outbox], [["ivy@example.com"]])
+        self.assertIn(str(TeamMemberContact.objects.get(pk=contact.pk).invitation_token), mail.outbox[0].body)
+        self.assertEqual(Job.objects.get().status, "done")
+
+    @override_settings(JOB_MAX_ATTEMPTS=1)
+    def test_undeliverable_invitation_marks_the_contact_failed(self):
+        ivy, kai = [
+            TeamMemberContact.objects.create(owner=self.owner, name=name, role="Editor", email=f"{name}@example.com")
+            for name in ("ivy", "kai")
+        ]
+        for contact in (ivy, kai):
+            self.client.post(f"/api/contacts/{contact.id}/resend_invitation/")
+        # A newer invitation supersedes Kai's failing one
+        stale = Job.objects.get(payload__contact_id=str(kai.id))
+        TeamMemberContact.objects.filter(pk=kai.pk).update(invitation_token=uuid.uuid4())
+
+        with mock.patch("django.core.mail.backends.locmem.EmailBackend.send_messages", side_effect=OSError("SMTP down")), \
+                self.assertLogs("api.jobs", "ERROR"):
+            Worker().run_once()
+
+        self.assertEqual(Job.objects.get(pk=stale.pk).status, "failed")
+        self.assertEqual(TeamMemberContact.objects.get(pk=ivy.pk).status, "failed")
+        self.assertEqual(TeamMemberContact.objects.get(pk=kai.pk).status, "sent")
+
+    def test_resend_invitation_needs_an_email(self):
+        contact = TeamMemberContact.objects.create(owner=self.owner, name="Noor", role="Editor")
+
+        response = self.client.post(f"/api/contacts/{contact.id}/resend_invitation/")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Job.objects.exists())
+
+    def test_worker_reuses_one_connection_per_drain(self):
+        self.queue_emails(5)
+
+        with mock.patch("api.jobs.get_connection", wraps=mail.get_connection) as get_connection:
+            Worker(batch_size=2).run_once()
+            Worker(batch_size=2).run(threading.Event(), once=True)
+
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(get_connection.call_count, 2)
+
+    def test_failures_back_off_then_give_up(self):
+        self.queue_emails(1)
+        job = Job.objects.get()
+
+        with mock.patch("django.core.mail.backends.locmem.EmailBackend.send_messages", side_effect=OSError("SMTP down")), \
+                self.assertLogs("api.jobs", "WARNING"):
+            Worker().run_once()
+            job.refresh_from_db()
+            self.assertEqual((job.status, job.attempts), ("queued", 1))
+            self.assertGreater(job.run_after, timezone.now())
+            self.assertIn("SMTP down", job.last_error)
+
+            # Not due yet
+            self.assertEqual(Worker().run_once(), 0)
+
+            Job.objects.update(run_after=timezone.now(), attempts=job.max_attempts - 1)
+            Worker().run_once()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(mail.outbox, [])
+
+    def test_run_workers_waits_for_workers_after_ctrl_c(self):
+        finished = []
+
+        class SlowWorker:
+            def __init__(self, **options):
+                pass
+
+            def run_in_thread(self, stop, once):
+                if threading.current_thread().name == "job-worker-1":
+                    _thread.interrupt_main()
+                stop.wait(5)
+                time.sleep(0.1)  # the rest of the batch in hand
+                finished.append(threading.current_thread().name)
+
+        # The test runner catches Ctrl-C itself; the command installs a SIGTERM handler
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            self.addCleanup(signal.signal, signum, signal.getsignal(signum))
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        with mock.patch("api.management.commands.run_workers.Worker", SlowWorker):
+            call_command("run_workers", "--workers", "2", stdout=StringIO())
+
+        self.assertEqual(sorted(finished), ["job-worker-0", "job-worker-1"])
+
+    def test_claim_skips_locked_rows(self):
+        self.queue_emails(1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            claimed = claim_jobs(10)
+
+        self.assertEqual([job.status for job in claimed], ["running"])
+        self.assertTrue(any("FOR UPDATE SKIP LOCKED" in q["sql"] for q in ctx.captured_queries))
+        self.assertEqual(claim_jobs(10), [])
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class RosterOnboardingTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="roster",
+            email="roster@example.com",
+            password="TestPass123!",
+        )
+        self.existing = User.objects.create_user(username="known", email="known@example.com")
+        self.client.force_authenticate(user=self.owner)
+
+    def roster(self, count, prefix="crew"):
+        return [
+            {"name": f"{prefix.title()} {n}", "role": "Photographer", "email": f"{prefix}{n}@example.com"}
+            for n in range(count)
+        ]
+
+    def test_creates_users_profiles_contacts_and_invitations(self):
+        rows = [
+            {"name": "Nia", "role": "Editor", "email": "nia@example.com", "phone_number": "0700"},
+            {"name": "Known", "role": "Drone", "email": "known@example.com"},
+            {"name": "No Email", "role": "Assistant"},
+        ]
+
+        response = self.client.post("/api/contacts/bulk/", rows, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        nia, known, no_email = response.data
+        user = User.objects.get(email="nia@example.com")
+        self.assertTrue(user.check_password(nia["generated_password"]))
+        self.assertEqual((user.profile.full_name, user.profile.role, user.profile.phone_number), ("Nia", "Editor", "0700"))
+        self.assertEqual(known["message"], "User already exists, added to team.")
+        self.assertEqual(User.objects.get(pk=self.existing.pk).profile.full_name, "Known")
+        self.assertNotIn("generated_password", no_email)
+
+        self.assertEqual(TeamMemberContact.objects.filter(owner=self.owner, status="joined").count(), 3)
+        self.assertEqual(
+            set(TeamAccess.objects.filter(owner=self.owner).values_list("member__email", flat=True)),
+            {"nia@example.com", "known@example.com"},
+        )
+        self.assertEqual(StudioStats.objects.get(owner=self.owner).team_members, 3)
+        self.assertEqual(
+            sorted(job.payload["recipient_list"][0] for job in Job.objects.all()),
+            ["known@example.com", "nia@example.com"],
+        )
+
+    def test_email_taken_as_another_users_username_only_adds_the_contact(self):
+        other = User.objects.create_user(username="moved@example.com", email="new-address@example.com")
+        other.profile.full_name = "Someone Else"
+        other.profile.save()
+
+        response = self.client.post("/api/contacts/bulk/", [
+            {"name": "Moved", "role": "Editor", "email": "moved@example.com"},
+        ], format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("generated_password", response.data[0])
+        self.assertNotIn("message", response.data[0])
+        self.assertTrue(TeamMemberContact.objects.filter(owner=self.owner, email="moved@example.com").exists())
+        self.assertEqual(User.objects.filter(username="moved@example.com").count(), 1)
+        self.assertEqual(User.objects.get(pk=other.pk).profile.full_name, "Someone Else")
+        self.assertFalse(TeamAccess.objects.filter(member=other, owner=self.owner).exists())
+
+    def test_query_count_does_not_grow_with_roster_size(self):
+        def queries(rows):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.post("/api/contacts/bulk/", rows, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            return len(ctx.captured_queries)
+
+        queries(self.roster(1, "warm"))  # first contact builds the owner's StudioStats row
+        self.assertEqual(queries(self.roster(3, "a")), queries(self.roster(30, "b")))
+
+    def test_invalid_row_writes_nothing(self):
+        rows = self.roster(2) + [{"email": "noname@example.com"}]
+
+        response = self.client.post("/api/contacts/bulk/", rows, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"][:2], [{}, {}])
+        self.assertIn("name", response.data["errors"][2])
+        self.assertFalse(User.objects.filter(email="crew0@example.com").exists())
+        self.assertFalse(TeamMemberContact.objects.exists())
+
+
+class DirtyFieldTrackingTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="dirty",
+            email="dirty@example.com",
+            password="TestPass123!",
+        )
+        project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Gil & Hal",
+            event_date="2026-05-01",
+            event_type="Wedding",
+            location="Malindi",
+            service_type="Photo",
+        )
+        self.event = Event.objects.create(project=project, event_name="Sangeet", event_date="2026-05-01")
+        self.client.force_authenticate(user=self.owner)
+
+    def updates(self, ctx, table):
+        return [q["sql"] for q in ctx.captured_queries if q["sql"].startswith(f'UPDATE "{table}"')]
+
+    def test_patch_updates_only_the_changed_column(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.patch(f"/api/events/{self.event.id}/", {"event_name": "Sangeet night"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        [update] = self.updates(ctx, "api_event")
+        set_clause = update.split(" SET ", 1)[1].split(" WHERE ", 1)[0]
+        self.assertEqual(set_clause.count(" = "), 2)
+        self.assertIn('"event_name" = ', set_clause)
+        self.assertIn('"updated_at" = ', set_clause)
+
+    def test_unchanged_save_is_skipped(self):
+        event = Event.objects.get(pk=self.event.pk)
+        event.event_name = "Sangeet"
+
+        with self.assertNumQueries(0):
+            event.save()
+
+    def test_user_saves_leave_profile_alone_unless_it_changed(self):
+        user = User.objects.select_related("profile").get(pk=self.owner.pk)
+
+        with CaptureQueriesContext(connection) as ctx:
+            user.last_login = timezone.now()
+            user.save(update_fields=["last_login"])
+        self.assertEqual(self.updates(ctx, "api_profile"), [])
+
+        user.profile.company_name = "Dirty Studio"
+        with CaptureQueriesContext(connection) as ctx:
+            user.save()
+        [update] = self.updates(ctx, "api_profile")
+        self.assertIn('"company_name"', update)
+        self.assertNotIn('"full_name"', update)
+        self.assertEqual(User.objects.get(pk=user.pk).profile.company_name, "Dirty Studio")
+
+
+@override_settings(DATABASE_REPLICA_ENABLED=True, REPLICA_PIN_SECONDS=30)
+class ReplicaRoutingTests(APITransactionTestCase):
+    # "replica" mirrors the test database over its own connection
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username="replica",
+            email="replica@example.com",
+            password="TestPass123!",
+        )
+        project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Jo & Kai",
+            event_date="2026-08-01",
+            event_type="Wedding",
+            location="Watamu",
+            service_type="Photo",
+        )
+        self.event = Event.objects.create(project=project, event_name="Haldi", event_date="2026-08-01")
+        self.client.force_authenticate(user=self.owner)
+
+    def get_tables(self, path):
+        with CaptureQueriesContext(connections["default"]) as primary, \
+                CaptureQueriesContext(connections["replica"]) as replica:
+            response = self.client.get(path)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return (
+            " ".join(q["sql"] for q in primary.captured_queries),
+            " ".join(q["sql"] for q in replica.captured_queries),
+        )
+
+    def test_list_and_retrieve_read_from_replica(self):
+        for path in ("/api/events/", f"/api/events/{self.event.id}/", "/api/calendar/?from=2026-08-01&to=2026-08-31"):
+            primary, replica = self.get_tables(path)
+            self.assertIn('"api_event"', replica, path)
+            self.assertNotIn('"api_event"', primary, path)
+
+    def test_reads_after_a_write_stay_on_primary_for_the_window(self):
+        response = self.client.patch(f"/api/events/{self.event.id}/", {"event_name": "Haldi lunch"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        primary, replica = self.get_tables("/api/events/")
+        self.assertIn('"api_event"', primary)
+        self.assertEqual(replica, "")
+
+        cache.clear()  # pin expired
+        primary, replica = self.get_tables("/api/events/")
+        self.assertIn('"api_event"', replica)
+
+    def test_write_inside_a_read_sends_the_rest_to_primary(self):
+        # Without a StudioStats row the dashboard rebuilds it, then reads it back
+        StudioStats.objects.filter(owner=self.owner).delete()
+        primary, replica = self.get_tables("/api/dashboard/stats/")
+
+        self.assertIn('INSERT INTO "api_studiostats"', primary)
+        self.assertNotIn('"api_studioactivity"', replica)
+
+    @override_settings(DATABASE_REPLICA_ENABLED=False)
+    def test_disabled_replica_is_never_used(self):
+        primary, replica = self.get_tables("/api/events/")
+        self.assertIn('"api_event"', primary)
+        self.assertEqual(replica, "")
+
+
+class QueryInstrumentationTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="timing",
+            email="timing@example.com",
+            password="TestPass123!",
+        )
+        project = WeddingProject.objects.create(
+            user=self.owner,
+            couple_name="Lee & Mo",
+            event_date="2026-09-01",
+            event_type="Wedding",
+            location="Lamu",
+            service_type="Photo",
+        )
+        Task.objects.create(project=project, title="Book boat")
+        self.client.force_authenticate(user=self.owner)
+
+    def metrics(self, response):
+        return {part.split(";")[0]: part for part in response["Server-Timing"].split(", ")}
+
+    def test_server_timing_reports_query_count_and_durations(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/tasks/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        metrics = self.metrics(response)
+        self.assertEqual(set(metrics), {"sql", "app", "total"})
+        self.assertIn(f'desc="{len(ctx.captured_queries)} queries"', metrics["sql"])
+        self.assertRegex(metrics["total"], r"^total;dur=\d+\.\d$")
+
+    @override_settings(SLOW_REQUEST_MS=0)
+    def test_slow_request_is_logged_with_its_sql(self):
+        with self.assertLogs("api.performance", "WARNING") as logs:
+            self.client.get("/api/tasks/")
+
+        [message] = logs.output
+        self.assertIn("Slow request GET /api/tasks/ -> 200", message)
+        self.assertIn('FROM "api_task"', message)
+
+    @override_settings(QUERY_REPEAT_DETECTION=True, QUERY_REPEAT_THRESHOLD=3)
+    def test_repeated_query_shapes_are_flagged(self):
+        users = [User.objects.create_user(username=f"n{i}", password="x") for i in range(3)]
+
+        def per_row_lookups(request):
+            for user in users:
+                User.objects.filter(pk=user.pk).exists()
+            User.objects.filter(pk__in=[user.pk for user in users]).count()
+            return HttpResponse()
+
+        middleware = QueryInstrumentationMiddleware(per_row_lookups)
+        with self.assertLogs("api.performance", "WARNING") as logs:
+            middleware(RequestFactory().get("/api/n-plus-one/"))
+
+        [message] = logs.output
+        self.assertIn("Possible N+1 in GET /api/n-plus-one/: query ran 3 times", message)
+        self.assertIn('WHERE "auth_user"."id" = %s LIMIT 1', message)
+
+    def test_query_shape_ignores_batch_sizes(self):
+        self.assertEqual(
+            query_shape('SELECT 1 FROM "t" WHERE "id" IN (%s, %s, %s)'),
+            query_shape('SELECT 1 FROM "t" WHERE "id" IN (%s, %s)'),
+        )
+        self.assertEqual(
+            query_shape('INSERT INTO "t" ("a") VALUES (%s), (%s)'),
+            'INSERT INTO "t" ("a") VALUES (%s)',
+        )
+
+
+class GenerateDatasetTests(APITestCase):
+    def generate(self, **options):
+        out = StringIO()
+        call_command(
+            "generate_dataset", studios=2, projects_per_studio=3, members_per_studio=4, freelancers_per_studio=1,
+            events_per_project=2, tasks_per_project=2, prefix="gen", stdout=out, **options,
+        )
+        return out.getvalue()
+
+    def test_generates_a_consistent_studio_graph(self):
+        output = self.generate()
+
+        self.assertIn("Generated 10 users, 10 contacts, 6 projects, 12 events, 12 tasks", output)
+        owner = User.objects.get(username="gen1-owner")
+        self.assertEqual(owner.profile.role, "admin")
+        stats = StudioStats.objects.get(owner=owner)
+        self.assertEqual(stats.team_members, 5)
+        self.assertEqual(stats.active_projects, owner.projects.filter(status="active").count())
+        # Signals are bypassed, so derived tables must be filled in directly
+        self.assertEqual(TeamAccess.objects.filter(owner=owner).count(), 5)
+        self.assertFalse(EventAssignment.objects.filter(member__isnull=True).exists())
+        columns = {}
+        for project_id, status_, position in Task.objects.values_list("project_id", "status", "position"):
+            columns.setdefault((project_id, status_), []).append(position)
+        self.assertTrue(all(sorted(positions) == list(range(len(positions))) for positions in columns.values()))
+
+        self.client.force_authenticate(user=User.objects.get(username="gen1-m1"))
+        response = self.client.get("/api/events/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreaterEqual(len(response.data), 6)
+
+    def test_refuses_to_reuse_a_prefix(self):
+        self.generate()
+        with self.assertRaises(CommandError):
+            self.generate()
+
+
+class SearchEndpointTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="search", email="search@example.com", password="TestPass123!")
+        self.owner.profile.role = "admin"
+        self.owner.profile.save()
+        self.project = WeddingProject.objects.create(
+            user=self.owner, couple_name="Amani & Jo", event_date="2026-10-01",
+            event_type="Wedding", location="Diani", service_type="Photo",
+        )
+        self.event = Event.objects.create(
+            project=self.project, event_name="Haldi", event_date="2026-09-30", details="Beach ceremony at sunrise",
+        )
+        self.task = Task.objects.create(project=self.project, title="Edit teaser", description="Sunrise drone shots")
+        self.contact = TeamMemberContact.objects.create(owner=self.owner, name="Zawadi", role="Drone Operator")
+
+        stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        WeddingProject.objects.create(
+            user=stranger, couple_name="Haldi & Co", event_date="2026-10-01",
+            event_type="Wedding", location="Diani", service_type="Photo",
+        )
+        self.client.force_authenticate(user=self.owner)
+
+    def search(self, **params):
+        response = self.client.get("/api/search/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [(hit["type"], hit["id"]) for hit in response.data["results"]]
+
+    def test_matches_word_prefixes_across_types(self):
+        self.assertEqual(self.search(q="hal"), [("event", self.event.id)])
+        self.assertEqual(self.search(q="diani"), [("project", self.project.id)])
+        self.assertEqual(self.search(q="teas"), [("task", self.task.id)])
+        self.assertEqual(self.search(q="zawadi"), [("contact", self.contact.id)])
+
+    def test_ranks_title_matches_above_body_matches(self):
+        Task.objects.create(project=self.project, title="Sunrise timelapse")
+
+        hits = self.search(q="sunrise")
+
+        self.assertEqual(hits[0][0], "task")
+        self.assertEqual({kind for kind, _ in hits}, {"task", "event"})
+        self.assertEqual(len(hits), 3)
+
+    def test_filters_by_type_and_requires_every_word(self):
+        self.assertEqual(self.search(q="drone", types="contact"), [("contact", self.contact.id)])
+        self.assertEqual(self.search(q="drone", types="contact,contact"), [("contact", self.contact.id)])
+        self.assertEqual(self.search(q="drone zawadi"), [("contact", self.contact.id)])
+        self.assertEqual(self.search(q="drone haldi"), [])
+
+    def test_bulk_created_rows_are_searchable(self):
+        Event.objects.bulk_create([
+            Event(project=self.project, event_name=f"Sangeet {n}", event_date="2026-09-29") for n in range(3)
+        ])
+
+        self.assertEqual(len(self.search(q="sangeet")), 3)
+
+    def test_team_members_search_the_owners_data(self):
+        member = User.objects.create_user(username="crew", email="crew@example.com")
+        TeamMemberContact.objects.create(owner=self.owner, name="Crew", role="Photographer", email="crew@example.com", status="joined")
+        self.client.force_authenticate(user=member)
+
+        self.assertEqual(self.search(q="haldi", types="event"), [("event", self.event.id)])
+
+    def test_rejects_empty_queries_and_unknown_types(self):
+        self.assertEqual(self.client.get("/api/search/", {"q": "  ?! "}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get("/api/search/", {"q": "haldi", "types": "invoice"}).status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TaskAssigneeTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="lead", email="lead@example.com", password="TestPass123!")
+        self.owner.profile.role = "admin"
+        self.owner.profile.save()
+        self.project = WeddingProject.objects.create(
+            user=self.owner, couple_name="Wanjiru & Tom", event_date="2026-11-01",
+            event_type="Wedding", location="Lamu", service_type="Photo",
+        )
+        self.editor = User.objects.create_user(username="editor", email="ann@example.com", password="TestPass123!")
+        self.editor.profile.full_name = "Ann Editor"
+        self.editor.profile.role = "editor"
+        self.editor.profile.save()
+        self.ann = TeamMemberContact.objects.create(
+            owner=self.owner, name="Ann", role="Editor", email="ann@example.com", status="joined",
+        )
+        self.bob = TeamMemberContact.objects.create(owner=self.owner, name="Bob", role="Editor")
+
+        stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        self.foreign_contact = TeamMemberContact.objects.create(owner=stranger, name="Ann", role="Editor")
+
+    def test_assigned_to_name_links_the_owners_contact(self):
+        task = Task.objects.create(project=self.project, title="Cull", assigned_to=" ann ")
+        self.assertEqual(task.assignee, self.ann)
+
+        task.assigned_to = "Nobody"
+        task.save()
+        task.refresh_from_db()
+        self.assertIsNone(task.assignee)
+        self.assertEqual(task.assigned_to, "Nobody")
+
+    def test_assignee_is_mirrored_into_assigned_to(self):
+        task = Task.objects.create(project=self.project, title="Cull", assignee=self.bob)
+        self.assertEqual(task.assigned_to, "Bob")
+
+        self.bob.name = "Robert"
+        self.bob.save()
+        task.refresh_from_db()
+        self.assertEqual((task.assignee, task.assigned_to), (self.bob, "Robert"))
+
+        task.assignee = None
+        task.save()
+        task.refresh_from_db()
+        self.assertIsNone(task.assigned_to)
+
+    def test_contact_rename_changes_task_etags(self):
+        task = Task.objects.create(project=self.project, title="Cull", assignee=self.bob)
+        self.client.force_authenticate(user=self.owner)
+        list_etag = self.client.get("/api/tasks/")["ETag"]
+        detail_etag = self.client.get(f"/api/tasks/{task.id}/")["ETag"]
+
+        self.bob.name = "Robert"
+        self.bob.save()
+
+        response = self.client.get("/api/tasks/", HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["assigned_to"], "Robert")
+        response = self.client.get(f"/api/tasks/{task.id}/", HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_members_see_tasks_linked_to_their_contact(self):
+        mine = Task.objects.create(project=self.project, title="Cull", assignee=self.ann)
+        Task.objects.create(project=self.project, title="Grade", assignee=self.bob)
+        by_role = Task.objects.create(project=self.project, title="Album", assigned_to="editor")
+        # Renaming the contact or the profile no longer hides the task
+        self.ann.name = "Ann K."
+        self.ann.save()
+        self.editor.profile.full_name = "Ann Kamau"
+        self.editor.profile.save()
+
+        self.client.force_authenticate(user=self.editor)
+        response = self.client.get("/api/tasks/")
+        self.assertEqual({row["id"] for row in response.data}, {str(mine.id), str(by_role.id)})
+
+    def test_assignee_filters(self):
+        mine = Task.objects.create(project=self.project, title="Cull", assignee=self.ann)
+        bobs = Task.objects.create(project=self.project, title="Grade", assignee=self.bob)
+        self.client.force_authenticate(user=self.owner)
+
+        response = self.client.get(f"/api/tasks/?assignee_id={self.bob.id}")
+        self.assertEqual([row["id"] for row in response.data], [str(bobs.id)])
+        self.assertEqual(response.data[0]["assignee"], self.bob.id)
+
+        self.client.force_authenticate(user=self.editor)
+        response = self.client.get("/api/tasks/?assignee_id=me")
+        self.assertEqual([row["id"] for row in response.data], [str(mine.id)])
+
+        for url in ("/api/tasks/", "/api/async/tasks/", "/api/tasks/board/"):
+            response = self.client.get(url, {"assignee_id": "abc"})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, url)
+            self.assertIn("assignee_id", response.data)
+
+    def test_writes_link_and_validate_assignees(self):
+        self.client.force_authenticate(user=self.owner)
+        response = self.client.post("/api/tasks/bulk/", [
+            {"project": str(self.project.id), "title": "Cull", "assigned_to": "Bob"},
+            {"project": str(self.project.id), "title": "Grade", "assignee": str(self.ann.id)},
+        ], format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [(row["assignee"], row["assigned_to"]) for row in response.data],
+            [(self.bob.id, "Bob"), (self.ann.id, "Ann")],
+        )
+
+        response = self.client.patch("/api/tasks/bulk/", [
+            {"id": response.data[0]["id"], "assigned_to": "Ann"},
+            {"id": response.data[1]["id"], "assignee": None},
+        ], format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(Task.objects.order_by("title").values_list("title", "assignee", "assigned_to")),
+            [("Cull", self.ann.id, "Ann"), ("Grade", None, None)],
+        )
+
+        response = self.client.post("/api/tasks/", {
+            "project": str(self.project.id), "title": "Print", "assignee": str(self.foreign_contact.id),
+        }, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("assignee", response.data)
+
+    def test_backfill_links_contact_and_profile_names(self):
+        backfill = import_module("api.migrations.0015_task_assignee").backfill_task_assignees
+        tasks = Task.objects.bulk_create([
+            Task(project=self.project, title="Cull", assigned_to="BOB"),
+            Task(project=self.project, title="Grade", assigned_to="Ann Editor"),
+            Task(project=self.project, title="Album", assigned_to="Photographer"),
+        ])
+
+        backfill(apps, None)
+
+        self.assertEqual(
+            [Task.objects.get(pk=task.pk).assignee_id for task in tasks], [self.bob.id, self.ann.id, None],
+        )
+
+
+class TaskBoardTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="board", email="board@example.com", password="TestPass123!")
+        self.owner.profile.role = "admin"
+        self.owner.profile.save()
+        self.project = WeddingProject.objects.create(
+            user=self.owner, couple_name="Imani & Rafael", event_date="2026-12-01",
+            event_type="Wedding", location="Watamu", service_type="Photo",
+        )
+        self.tasks = {
+            title: Task.objects.create(project=self.project, title=title, status=status_, position=position)
+            for title, status_, position in [
+                ("Cull", "backlog", 2), ("Grade", "backlog", 0), ("Album", "backlog", 1),
+                ("Teaser", "editing", 0),
+            ]
+        }
+        stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        other_project = WeddingProject.objects.create(
+            user=stranger, couple_name="Other", event_date="2026-12-01",
+            event_type="Wedding", location="Watamu", service_type="Photo",
+        )
+        self.foreign_task = Task.objects.create(project=other_project, title="Secret", status="backlog")
+        self.client.force_authenticate(user=self.owner)
+
+    def board(self, url="/api/tasks/board/", **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {
+            column["status"]: (column["count"], [task["title"] for task in column["results"]], column["next"])
+            for column in response.data["columns"]
+        }
+
+    def test_columns_are_grouped_counted_and_ordered_by_position(self):
+        board = self.board()
+        self.assertEqual(board, {
+            "backlog": (3, ["Grade", "Album", "Cull"], None),
+            "editing": (1, ["Teaser"], None),
+        })
+
+        board = self.board(status="delivered,editing")
+        self.assertEqual(list(board), ["delivered", "editing"])
+        self.assertEqual(board["delivered"], (0, [], None))
+
+    def test_columns_page_with_their_own_cursor(self):
+        with CaptureQueriesContext(connection) as queries:
+            board = self.board(page_size=2)
+        self.assertEqual(len([q for q in queries if "api_task" in q["sql"]]), 1)
+        count, titles, next_link = board["backlog"]
+        self.assertEqual((count, titles), (3, ["Grade", "Album"]))
+        self.assertIsNone(board["editing"][2])
+
+        board = self.board(next_link)
+        self.assertEqual(board, {"backlog": (3, ["Cull"], None)})
+
+        response = self.client.get("/api/tasks/board/", {"cursor": next_link.split("cursor=")[1].split("&")[0]})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_studio_board_keeps_each_projects_cards_together(self):
+        second = WeddingProject.objects.create(
+            user=self.owner, couple_name="Zawadi & Tom", event_date="2026-12-08",
+            event_type="Wedding", location="Lamu", service_type="Photo",
+        )
+        Task.objects.create(project=second, title="Proof", status="backlog", position=0)
+        Task.objects.create(project=second, title="Print", status="backlog", position=1)
+        expected = [
+            task.title for task in sorted(
+                Task.objects.filter(project__user=self.owner, status="backlog"), key=lambda task: (task.project_id, task.position),
+            )
+        ]
+
+        count, titles, next_link = self.board(status="backlog", page_size=2)["backlog"]
+        while next_link:
+            _, page, next_link = self.board(next_link)["backlog"]
+            titles += page
+        self.assertEqual((count, titles), (5, expected))
+
+        project_board = self.board(status="backlog", project_id=second.pk)
+        self.assertEqual(project_board["backlog"], (2, ["Proof", "Print"], None))
+
+    def test_new_tasks_are_appended_to_their_column(self):
+        def task(title, status_, **extra):
+            return {"project": str(self.project.id), "title": title, "status": status_, **extra}
+
+        response = self.client.post("/api/tasks/", task("Export", "backlog"), format="json")
+        self.assertEqual(response.data["position"], 3)
+        response = self.client.post("/api/tasks/", task("Deliver", "delivered"), format="json")
+        self.assertEqual(response.data["position"], 0)
+
+        response = self.client.post("/api/tasks/bulk/", [
+            task("Print", "backlog"), task("Cut", "editing"), task("Pinned", "backlog", position=0), task("Frame", "backlog"),
+        ], format="json")
+        self.assertEqual([row["position"] for row in response.data], [4, 1, 0, 5])
+        self.assertEqual(self.board(status="backlog")["backlog"][1][-3:], ["Export", "Print", "Frame"])
+
+    def test_move_updates_status_and_position_in_one_write(self):
+        moves = [
+            {"id": str(self.tasks["Teaser"].id), "status": "backlog", "position": 0},
+            {"id": str(self.tasks["Grade"].id), "status": "backlog", "position": 1},
+            {"id": str(self.tasks["Album"].id), "status": "editing", "position": 0},
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post("/api/tasks/move/", moves, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len([q for q in queries if q["sql"].startswith("UPDATE")]), 1)
+
+        self.assertEqual(self.board(), {
+            "backlog": (3, ["Teaser", "Grade", "Cull"], None),
+            "editing": (1, ["Album"], None),
+        })
+
+    def test_move_rejects_invalid_or_foreign_cards(self):
+        response = self.client.post("/api/tasks/move/", [
+            {"id": str(self.tasks["Cull"].id), "status": "editing", "position": -1},
+        ], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("position", response.data["errors"][0])
+
+        response = self.client.post("/api/tasks/move/", [
+            {"id": str(self.tasks["Cull"].id), "status": "editing", "position": 2**31},
+        ], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("position", response.data["errors"][0])
+
+        response = self.client.post("/api/tasks/move/", [
+            {"id": str(self.tasks["Cull"].id), "status": "editing", "position": 0},
+            {"id": str(self.foreign_task.id), "status": "editing", "position": 1},
+        ], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"], [{}, {"id": ["Not found."]}])
+        self.assertEqual(Task.objects.get(pk=self.tasks["Cull"].pk).status, "backlog")
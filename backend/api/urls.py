@@ -4,7 +4,8 @@ from rest_framework.authtoken.views import obtain_auth_token
 from .views import (
     ProfileViewSet, WeddingProjectViewSet, EventViewSet, 
     TaskViewSet, EventChecklistViewSet, FileSubmissionViewSet, 
-    TeamMemberContactViewSet, UserPreferenceViewSet, RegisterView, CustomLoginView, DashboardStatsView
+    TeamMemberContactViewSet, UserPreferenceViewSet, RegisterView, CustomLoginView, DashboardStatsView, CalendarView, SearchView,
+    AsyncEventListView, AsyncTaskListView, AsyncDashboardStatsView,
 )
 
 router = DefaultRouter()
@@ -22,6 +23,12 @@ urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
     path('login/', CustomLoginView.as_view(), name='login'),
     path('dashboard/stats/', DashboardStatsView.as_view(), name='dashboard-stats'),
+    path('calendar/', CalendarView.as_view(), name='calendar'),
+    path('search/', SearchView.as_view(), name='search'),
+    # Async read paths, for ASGI deployments (see README "Running under ASGI")
+    path('async/events/', AsyncEventListView.as_view(), name='async-event-list'),
+    path('async/tasks/', AsyncTaskListView.as_view(), name='async-task-list'),
+    path('async/dashboard/stats/', AsyncDashboardStatsView.as_view(), name='async-dashboard-stats'),
     path('dj-rest-auth/', include('dj_rest_auth.urls')),
     path('dj-rest-auth/registration/', include('dj_rest_auth.registration.urls')),
 ]
@@ -0,0 +1,7 @@
+"""
+Standalone benchmarks for the api backend.
+
+Run from backend/, e.g. ``python -m benchmarks.team_access``. Each benchmark
+creates (and drops) its own throwaway ``test_`` database, so the development
+data is never touched.
+"""
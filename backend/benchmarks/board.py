@@ -0,0 +1,86 @@
+"""
+Kanban board reads and moves on a generated dataset, against what the board
+used to do on the client.
+
+Reports, as one studio owner:
+- one project's board: GET /api/tasks/?project_id= (every task, grouped on the
+  client) vs GET /api/tasks/board/?project_id= (first page of each column and
+  its count, one windowed query)
+- the same for the whole studio, without the project filter
+- reordering one column after a drag: one PATCH per renumbered card vs a
+  single POST /api/tasks/move/
+
+    python -m benchmarks.board [--tasks-per-project 200] [--page-size 20]
+"""
+import argparse
+
+from benchmarks.harness import measure, print_table, throwaway_database
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count
+from rest_framework.test import APIClient
+
+from api.models import Task
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--studios", type=int, default=10)
+    parser.add_argument("--projects-per-studio", type=int, default=20)
+    parser.add_argument("--tasks-per-project", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+
+    with throwaway_database():
+        call_command("generate_dataset", studios=args.studios, projects_per_studio=args.projects_per_studio,
+                     tasks_per_project=args.tasks_per_project)
+        with connection.cursor() as cursor:
+            cursor.execute("VACUUM ANALYZE")
+        owner = User.objects.get(username="studio1-owner")
+        project = owner.projects.first()
+        client = APIClient()
+        client.force_authenticate(user=owner)
+
+        def get(path):
+            def request():
+                response = client.get(path)
+                assert response.status_code == 200, response.content
+                return response
+            return request
+
+        rows = []
+        for label, query in [("project", f"project_id={project.pk}&"), ("studio", "")]:
+            for endpoint, path in [
+                ("list + client grouping", f"/api/tasks/?{query}"),
+                ("board", f"/api/tasks/board/?{query}page_size={args.page_size}"),
+            ]:
+                size = len(get(path)().content)
+                timing = measure(get(path))
+                rows.append((f"{label}: {endpoint}", size, f"{timing['p50']:.1f}", f"{timing['p95']:.1f}"))
+
+        # The project's fullest column
+        status = Task.objects.filter(project=project).values("status").annotate(n=Count("id")).order_by("-n")[0]["status"]
+        ids = [str(pk) for pk in Task.objects.filter(project=project, status=status).order_by("position", "id")
+               .values_list("pk", flat=True)]
+
+        def patch_each():
+            ids.append(ids.pop(0))
+            for position, pk in enumerate(ids):
+                assert client.patch(f"/api/tasks/{pk}/", {"position": position}, format="json").status_code == 200
+
+        def move():
+            ids.append(ids.pop(0))
+            moves = [{"id": pk, "status": status, "position": position} for position, pk in enumerate(ids)]
+            assert client.post("/api/tasks/move/", moves, format="json").status_code == 200
+
+        for endpoint, fn in [("one PATCH per card", patch_each), ("POST /api/tasks/move/", move)]:
+            timing = measure(fn, repeat=5, warmup=1)
+            rows.append((f"reorder {len(ids)} cards: {endpoint}", "-", f"{timing['p50']:.1f}", f"{timing['p95']:.1f}"))
+
+    print_table(["case", "bytes", "p50 ms", "p95 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Sync WSGI workers vs ASGI under concurrent clients.
+
+Starts gunicorn (sync workers, config.wsgi) serving /api/events/ and then
+uvicorn (config.asgi) serving the async twin /api/async/events/, each with
+the same number of worker processes, and drives both with --clients
+concurrent keep-alive clients for --seconds. Reports throughput, latency
+percentiles and failed requests.
+
+A sync worker holds its process while Postgres answers, so requests queue
+behind one another; the async view yields the event loop instead.
+
+    python -m benchmarks.concurrency [--clients 200] [--workers 2] [--seconds 15]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks.harness import print_table, throwaway_database
+
+from django.contrib.auth.models import User
+from django.db import connection
+from rest_framework.authtoken.models import Token
+
+from api.models import Event, WeddingProject
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def seed(events):
+    owner = User.objects.create_user(username="load", email="load@example.com")
+    owner.profile.role = "admin"
+    owner.profile.save()
+    project = WeddingProject.objects.create(
+        user=owner, couple_name="Load & Test", event_date="2026-06-01",
+        event_type="Wedding", location="Nairobi", service_type="Photo",
+    )
+    Event.objects.bulk_create(
+        Event(project=project, event_name=f"Event {n}", event_date="2026-06-01")
+        for n in range(events)
+    )
+    return Token.objects.create(user=owner).key
+
+
+def server_command(kind, port, workers):
+    if kind == "wsgi":
+        return [sys.executable, "-m", "gunicorn", "config.wsgi:application", "--worker-class", "sync",
+                "--workers", str(workers), "--bind", f"127.0.0.1:{port}", "--log-level", "warning"]
+    return [sys.executable, "-m", "uvicorn", "config.asgi:application", "--workers", str(workers),
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning", "--no-access-log"]
+
+
+def start_server(command, port, env=None):
+    """Start `command` against the throwaway database and wait until it answers on `port`."""
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE="benchmarks.server_settings",
+               BENCHMARK_DATABASE_NAME=connection.settings_dict["NAME"], **(env or {}))
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f"http://127.0.0.1:{port}/api/", timeout=5)
+            return process
+        except requests.RequestException:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"{command[2]} did not start on port {port}")
+
+
+def drive(url, token, clients, seconds):
+    latencies, failures = [], 0
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def client():
+        nonlocal failures
+        session = requests.Session()
+        session.headers["Authorization"] = f"Token {token}"
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                ok = session.get(url, timeout=30).status_code == 200
+            except requests.RequestException:
+                ok = False
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                if ok:
+                    latencies.append(elapsed)
+                else:
+                    failures += 1
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        for _ in range(clients):
+            pool.submit(client)
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / seconds,
+        "p50": statistics.median(latencies) if latencies else 0,
+        "p95": latencies[int(len(latencies) * 0.95)] if latencies else 0,
+        "p99": latencies[int(len(latencies) * 0.99)] if latencies else 0,
+        "failures": failures,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--seconds", type=int, default=15)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    rows = []
+    with throwaway_database():
+        token = seed(args.events)
+        # Servers open their own connections; ours must not hold the database
+        connection.close()
+        for kind, path in (("wsgi", "/api/events/"), ("asgi", "/api/async/events/")):
+            process = start_server(server_command(kind, args.port, args.workers), args.port)
+            try:
+                result = drive(f"http://127.0.0.1:{args.port}{path}", token, args.clients, args.seconds)
+            finally:
+                process.terminate()
+                process.wait()
+            rows.append((kind, path, args.workers, args.clients, f"{result['rps']:.1f}",
+                         f"{result['p50']:.0f}", f"{result['p95']:.0f}", result["failures"]))
+
+    print_table(["server", "endpoint", "workers", "clients", "req/s", "p50 ms", "p95 ms", "failures"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Request latency for each DB_CONN_MODE (none, persistent, pool).
+
+Serves /api/events/ with gunicorn threaded workers against the Postgres in
+settings (the docker-compose `db` service by default) and drives it with
+--clients concurrent clients per mode. "none" pays the connect and auth
+handshake on every request; "persistent" keeps one connection per worker
+thread; "pool" shares --pool-max connections per process.
+
+    python -m benchmarks.connections [--clients 50] [--seconds 15]
+"""
+import argparse
+import sys
+
+from benchmarks.concurrency import drive, seed, start_server
+from benchmarks.harness import print_table, throwaway_database
+
+from django.db import connection
+
+MODES = ("none", "persistent", "pool")
+
+
+def gunicorn_command(port, workers, threads):
+    return [sys.executable, "-m", "gunicorn", "config.wsgi:application", "--worker-class", "gthread",
+            "--workers", str(workers), "--threads", str(threads), "--bind", f"127.0.0.1:{port}",
+            "--log-level", "warning"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--pool-max", type=int, default=4)
+    parser.add_argument("--seconds", type=int, default=15)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    rows = []
+    with throwaway_database():
+        token = seed(args.events)
+        connection.close()
+        for mode in MODES:
+            env = {"DB_CONN_MODE": mode, "DB_POOL_MIN_SIZE": "2", "DB_POOL_MAX_SIZE": str(args.pool_max)}
+            process = start_server(gunicorn_command(args.port, args.workers, args.threads), args.port, env)
+            try:
+                result = drive(f"http://127.0.0.1:{args.port}/api/events/", token, args.clients, args.seconds)
+            finally:
+                process.terminate()
+                process.wait()
+            rows.append((mode, f"{result['rps']:.1f}", f"{result['p50']:.0f}", f"{result['p99']:.0f}", result["failures"]))
+
+    print_table(["DB_CONN_MODE", "req/s", "p50 ms", "p99 ms", "failures"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Endpoint load test against a generated large-studio dataset.
+
+Fills a throwaway database with `manage.py generate_dataset`, starts the API
+under gunicorn (or uvicorn with --server asgi) and drives every GET route of
+the api router (list, detail and GET actions) plus the dashboard, calendar
+and async read paths, one endpoint at a time, as the first studio owner.
+Login, registration and write endpoints are not driven.
+
+Prints latency percentiles, throughput and the SQL query count per request
+(from the Server-Timing header), and with --output writes the same numbers as
+JSON, to keep as a baseline and diff against later runs.
+
+    python -m benchmarks.load [--studios 20] [--projects-per-studio 50] [--clients 20] [--seconds 5] \
+        [--output baseline.json]
+"""
+import argparse
+import json
+import re
+from datetime import date, timedelta
+
+import requests
+
+from benchmarks.concurrency import drive, server_command, start_server
+from benchmarks.harness import print_table, throwaway_database
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from rest_framework.authtoken.models import Token
+
+from api.models import Event, EventChecklist, FileSubmission, Task, TeamMemberContact, UserPreference
+from api.urls import router
+
+# Query strings for router actions that need one
+ACTION_QUERIES = {
+    'check_invitation': lambda ids: f"?token={ids['invitation_token']}",
+}
+
+
+def detail_ids(owner):
+    """One object per router basename that `owner` can read."""
+    project = owner.projects.order_by('-event_date').first()
+    event = Event.objects.filter(project__user=owner).first()
+    contact = TeamMemberContact.objects.filter(owner=owner).first()
+    return {
+        'profile': owner.profile.pk,
+        'project': project.pk,
+        'event': event.pk,
+        'task': Task.objects.filter(project__user=owner).first().pk,
+        'checklist': EventChecklist.objects.filter(event__project__user=owner).first().pk,
+        'submission': FileSubmission.objects.filter(event__project__user=owner).first().pk,
+        'contact': contact.pk,
+        'preference': UserPreference.objects.filter(user=owner).first().pk,
+        'invitation_token': contact.invitation_token,
+    }
+
+
+def endpoints(ids, page_size=None):
+    list_query = f"?page_size={page_size}" if page_size else ""
+    paths = []
+    for prefix, viewset, basename in router.registry:
+        paths.append(f"/api/{prefix}/{list_query}")
+        paths.append(f"/api/{prefix}/{ids[basename]}/")
+        for action in viewset.get_extra_actions():
+            if 'get' not in action.mapping:
+                continue
+            base = f"/api/{prefix}/{ids[basename]}" if action.detail else f"/api/{prefix}"
+            query = ACTION_QUERIES.get(action.__name__, lambda ids: "")(ids)
+            paths.append(f"{base}/{action.url_path}/{query}")
+
+    today = date.today()
+    paths += [
+        "/api/dashboard/stats/",
+        f"/api/calendar/?from={today}&to={today + timedelta(days=30)}",
+        f"/api/calendar/?from={today}&to={today + timedelta(days=365)}&granularity=month",
+        f"/api/async/events/{list_query}",
+        f"/api/async/tasks/{list_query}",
+        "/api/async/dashboard/stats/",
+    ]
+    return paths
+
+
+def probe(url, token):
+    """One request: status, response size and the query count from Server-Timing."""
+    response = requests.get(url, headers={"Authorization": f"Token {token}"}, timeout=60)
+    match = re.search(r'desc="(\d+) queries"', response.headers.get("Server-Timing", ""))
+    return response.status_code, len(response.content), int(match.group(1)) if match else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--studios", type=int, default=20)
+    parser.add_argument("--projects-per-studio", type=int, default=50)
+    parser.add_argument("--server", choices=("wsgi", "asgi"), default="wsgi")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--seconds", type=int, default=5, help="Seconds per endpoint")
+    parser.add_argument("--page-size", type=int, default=None, help="Request list endpoints with ?page_size=")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    results = []
+    with throwaway_database():
+        call_command("generate_dataset", studios=args.studios, projects_per_studio=args.projects_per_studio)
+        owner = User.objects.select_related("profile").get(username="studio1-owner")
+        token = Token.objects.create(user=owner).key
+        paths = endpoints(detail_ids(owner), args.page_size)
+        # Servers open their own connections; ours must not hold the database
+        connection.close()
+
+        # Slow-request warnings would drown the report
+        process = start_server(server_command(args.server, args.port, args.workers), args.port,
+                               env={"SLOW_REQUEST_MS": str(10 ** 9)})
+        try:
+            for path in paths:
+                url = f"http://127.0.0.1:{args.port}{path}"
+                status, size, queries = probe(url, token)
+                result = drive(url, token, args.clients, args.seconds) if status == 200 else {}
+                result = {key: round(value, 1) for key, value in result.items()}
+                results.append({"endpoint": path, "status": status, "bytes": size, "queries": queries, **result})
+        finally:
+            process.terminate()
+            process.wait()
+
+    print_table(
+        ["endpoint", "status", "queries", "bytes", "req/s", "p50 ms", "p95 ms", "p99 ms", "failures"],
+        [
+            (r["endpoint"], r["status"], r["queries"], r["bytes"], f"{r.get('rps', 0):.1f}", f"{r.get('p50', 0):.0f}",
+             f"{r.get('p95', 0):.0f}", f"{r.get('p99', 0):.0f}", r.get("failures", "-"))
+            for r in results
+        ],
+    )
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump({
+                "dataset": {"studios": args.studios, "projects_per_studio": args.projects_per_studio},
+                "server": args.server, "workers": args.workers, "clients": args.clients,
+                "seconds": args.seconds, "page_size": args.page_size,
+                "results": results,
+            }, fh, indent=2)
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
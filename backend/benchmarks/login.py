@@ -0,0 +1,101 @@
+"""
+Login capacity for CustomLoginView.
+
+Reports, for a table of --users accounts:
+- user lookup latency: the previous iexact OR query vs find_login_user()
+- password hash cost (check_password with the configured hasher)
+- end-to-end POST /api/login/ throughput, sequential and with --workers
+  concurrent threads (PBKDF2 releases the GIL, so threads approximate
+  per-core scaling)
+
+The hash dominates: logins/s per core is roughly 1000 / hash ms.
+
+    python -m benchmarks.login [--users 20000] [--workers 4]
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.harness import measure, print_table, throwaway_database
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import connection, connections
+from django.db.models import Q
+from rest_framework.test import APIClient
+
+from api.views import find_login_user
+
+PASSWORD = "MondayMorning123!"
+
+
+def seed(count):
+    password = make_password(PASSWORD)
+    User.objects.bulk_create(
+        (User(username=f"crew{n}", email=f"Crew{n}@Example.com", password=password) for n in range(count)),
+        batch_size=5000,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE auth_user")
+
+
+def legacy_lookup(identifier):
+    try:
+        return User.objects.get(Q(username__iexact=identifier) | Q(email__iexact=identifier))
+    except User.DoesNotExist:
+        return None
+
+
+def login_once(n):
+    response = APIClient().post("/api/login/", {"username": f"crew{n}@example.com", "password": PASSWORD}, format="json")
+    assert response.status_code == 200, response.content
+
+
+def throughput(workers, logins):
+    start = time.perf_counter()
+    if workers == 1:
+        for n in range(logins):
+            login_once(n)
+    else:
+        def run(n):
+            try:
+                login_once(n)
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(run, range(logins)))
+    return logins / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with throwaway_database():
+        seed(args.users)
+        identifier = f"CREW{args.users // 2}@example.com"
+        user = User.objects.get(username=f"crew{args.users // 2}")
+
+        legacy = measure(lambda: legacy_lookup(identifier))
+        indexed = measure(lambda: find_login_user(identifier))
+        hashing = measure(lambda: user.check_password(PASSWORD), repeat=5, warmup=1)
+        sequential = throughput(1, args.logins)
+        concurrent = throughput(args.workers, args.logins * args.workers)
+
+    print_table(["measurement", "value"], [
+        ("users", args.users),
+        ("legacy iexact lookup p50 ms", f"{legacy['p50']:.2f}"),
+        ("find_login_user p50 ms", f"{indexed['p50']:.2f}"),
+        ("check_password p50 ms", f"{hashing['p50']:.1f}"),
+        ("hash-bound logins/s per core", f"{1000 / hashing['p50']:.1f}"),
+        ("POST /api/login/ logins/s (1 worker)", f"{sequential:.1f}"),
+        (f"POST /api/login/ logins/s ({args.workers} workers)", f"{concurrent:.1f}"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+/api/search/ latency on a generated dataset of roughly --rows searchable rows
+(projects, events, tasks and contacts), against the `icontains` scans the
+frontend filters used to stand in for.
+
+Reports, for a few typical queries run as one studio owner:
+- GET /api/search/ (stored tsvector columns, GIN indexes, one UNION query),
+  end to end and its SQL time alone (from the Server-Timing header)
+- the same matches found with OR-ed icontains filters on every column
+  (ORM queries only, so this column excludes the request overhead)
+
+    python -m benchmarks.search [--rows 100000]
+"""
+import argparse
+import re
+import statistics
+
+from benchmarks.harness import measure, print_table, throwaway_database
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Q
+from rest_framework.test import APIClient
+
+from api.models import Event, Task, TeamMemberContact, WeddingProject
+
+QUERIES = ("haldi", "edit teaser", "diani", "drone", "gallery")
+
+# Searchable rows generate_dataset creates per project (1 project, 4 events, 10 tasks)
+ROWS_PER_PROJECT = 15
+
+
+def icontains_search(user, text):
+    def matches(*columns):
+        condition = Q()
+        for word in text.split():
+            condition &= Q(*[Q(**{f"{column}__icontains": word}) for column in columns], _connector=Q.OR)
+        return condition
+
+    scope = Q(project__user=user)
+    return (
+        list(WeddingProject.objects.filter(matches("couple_name", "location"), user=user)[:20])
+        + list(Event.objects.filter(matches("event_name", "location", "details"), scope)[:20])
+        + list(Task.objects.filter(matches("title", "description"), scope)[:20])
+        + list(TeamMemberContact.objects.filter(matches("name", "role"), owner=user)[:20])
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--studios", type=int, default=100)
+    args = parser.parse_args()
+
+    with throwaway_database():
+        projects = max(1, args.rows // ROWS_PER_PROJECT // args.studios)
+        call_command("generate_dataset", studios=args.studios, projects_per_studio=projects)
+        # Steady state: autovacuum has merged the GIN pending lists the bulk insert left
+        with connection.cursor() as cursor:
+            cursor.execute("VACUUM ANALYZE")
+        owner = User.objects.get(username="studio1-owner")
+        client = APIClient()
+        client.force_authenticate(user=owner)
+
+        rows = []
+        for text in QUERIES:
+            sql_ms = []
+
+            def search():
+                response = client.get("/api/search/", {"q": text})
+                assert response.status_code == 200, response.content
+                sql_ms.append(float(re.search(r"sql;dur=([\d.]+)", response["Server-Timing"]).group(1)))
+                return response.data["results"]
+
+            hits = len(search())
+            fts = measure(search)
+            scan = measure(lambda: icontains_search(owner, text))
+            rows.append((text, hits, f"{fts['p50']:.1f}", f"{fts['p95']:.1f}", f"{statistics.median(sql_ms):.1f}",
+                         f"{scan['p50']:.1f}", f"{scan['p95']:.1f}"))
+
+    print_table(["query", "hits", "search p50 ms", "search p95 ms", "search SQL p50 ms",
+                 "icontains p50 ms", "icontains p95 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Serialize, render and parse 10k Events and Tasks with DRF's JSON renderer /
+parser ("before") and the orjson-backed ones ("after"), reporting throughput
+and peak allocations (tracemalloc).
+
+Instances are built in memory, so no database is needed.
+
+    python -m benchmarks.serialization [--rows 10000]
+"""
+import argparse
+import datetime
+import io
+import tracemalloc
+import uuid
+
+from benchmarks.harness import measure, print_table
+
+from django.contrib.auth.models import User
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.models import Event, Task, WeddingProject
+from api.renderers import ORJSONParser, ORJSONRenderer
+from api.serializers import EventSerializer, TaskSerializer
+
+
+def build_rows(count):
+    now = timezone.now()
+    owner = User(pk=1, username="owner")
+    projects = [
+        WeddingProject(
+            id=uuid.uuid4(), user=owner, couple_name=f"Couple {n}", event_date=datetime.date(2026, 6, 1),
+            event_type="Wedding", location="Nairobi", service_type="Photo + Video",
+            created_at=now, updated_at=now,
+        )
+        for n in range(50)
+    ]
+    events = [
+        Event(
+            id=uuid.uuid4(), project=projects[n % len(projects)], event_name=f"Event {n}",
+            event_date=datetime.date(2026, 6, 1), time_from=datetime.time(10), time_to=datetime.time(18),
+            location="Karen", photographer="Ann, Bob", details="Brief " * 20,
+            created_at=now, updated_at=now,
+        )
+        for n in range(count)
+    ]
+    tasks = [
+        Task(
+            id=uuid.uuid4(), project=projects[n % len(projects)], title=f"Task {n}",
+            due_date=datetime.date(2026, 7, 1), assigned_to="Ann", description="Cull and grade " * 10,
+            created_at=now, updated_at=now,
+        )
+        for n in range(count)
+    ]
+    return events, tasks
+
+
+def peak_kib(fn):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    events, tasks = build_rows(args.rows)
+    rows = []
+    for label, serializer_class, instances in [("events", EventSerializer, events), ("tasks", TaskSerializer, tasks)]:
+        serialize = lambda: serializer_class(instances, many=True).data
+        data = serialize()
+        stats = measure(serialize, repeat=args.repeat, warmup=1)
+        rows.append((label, "serializer.data", "-", f"{stats['p50']:.1f}",
+                     f"{args.rows / stats['p50'] * 1000:,.0f}", f"{peak_kib(serialize):,.0f}"))
+
+        for name, renderer in [("before", JSONRenderer()), ("after", ORJSONRenderer())]:
+            render = lambda: renderer.render(data)
+            stats = measure(render, repeat=args.repeat, warmup=1)
+            rows.append((label, "render", name, f"{stats['p50']:.1f}",
+                         f"{args.rows / stats['p50'] * 1000:,.0f}", f"{peak_kib(render):,.0f}"))
+
+        body = JSONRenderer().render(data)
+        for name, json_parser in [("before", JSONParser()), ("after", ORJSONParser())]:
+            parse = lambda: json_parser.parse(io.BytesIO(body))
+            stats = measure(parse, repeat=args.repeat, warmup=1)
+            rows.append((label, "parse", name, f"{stats['p50']:.1f}",
+                         f"{args.rows / stats['p50'] * 1000:,.0f}", f"{peak_kib(parse):,.0f}"))
+
+    print_table(["model", "phase", "variant", "p50 ms", "rows/s", "peak KiB"], rows)
+
+
+if __name__ == "__main__":
+    main()
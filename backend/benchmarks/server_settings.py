@@ -0,0 +1,13 @@
+"""
+Settings for the servers started by benchmarks.concurrency: production-like
+(DEBUG off, so queries are not recorded) and pointed at the benchmark's
+throwaway database.
+"""
+import os
+
+from config.settings import *  # noqa: F401,F403
+from config.settings import DATABASES
+
+DEBUG = False
+ALLOWED_HOSTS = ["127.0.0.1", "localhost"]
+DATABASES["default"]["NAME"] = os.environ["BENCHMARK_DATABASE_NAME"]
@@ -0,0 +1,105 @@
+"""
+List latency for team-scoped viewsets against the number of owners and members.
+
+Compares the materialized TeamAccess lookup (`user_id IN (...)`, no DISTINCT)
+with the previous subquery + OR + DISTINCT filter, both at the queryset level
+and through the full /api/events/ endpoint.
+
+    python -m benchmarks.team_access [--events-per-owner 50]
+"""
+import argparse
+import itertools
+
+from benchmarks.harness import measure, print_table, throwaway_database
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from rest_framework.test import APIClient
+
+from api.models import Event, TeamMemberContact, WeddingProject
+
+GRID = [(5, 10), (20, 40), (80, 40), (80, 160)]
+
+
+def seed(owners, members, events_per_owner):
+    owner_users = [
+        User.objects.create_user(username=f"owner{i}", email=f"owner{i}@example.com")
+        for i in range(owners)
+    ]
+    member_users = [
+        User.objects.create_user(username=f"member{i}", email=f"member{i}@example.com")
+        for i in range(members)
+    ]
+    projects = WeddingProject.objects.bulk_create(
+        WeddingProject(
+            user=owner, couple_name=f"Couple {owner.pk}", event_date="2026-06-01",
+            event_type="Wedding", location="Nairobi", service_type="Photo",
+        )
+        for owner in owner_users
+    )
+    Event.objects.bulk_create(
+        Event(project=project, event_name=f"Event {n}", event_date="2026-06-01")
+        for project in projects for n in range(events_per_owner)
+    )
+    # Every member works for a quarter of the studios (at least one)
+    per_member = max(1, owners // 4)
+    owner_cycle = itertools.cycle(owner_users)
+    for member in member_users:
+        for _ in range(per_member):
+            TeamMemberContact.objects.create(
+                owner=next(owner_cycle), name=member.username, role="Photographer",
+                email=member.email, status="joined",
+            )
+    return member_users[0]
+
+
+def legacy_queryset(user):
+    owners_owning_me = TeamMemberContact.objects.filter(
+        email=user.email, status__in=["sent", "joined"]
+    ).values_list("owner", flat=True)
+    return Event.objects.select_related("project").filter(
+        Q(project__user=user) | Q(project__user__in=owners_owning_me)
+    ).distinct()
+
+
+def access_queryset(user):
+    owner_ids = [user.pk, *user.team_access.values_list("owner_id", flat=True)]
+    return Event.objects.select_related("project").filter(project__user_id__in=owner_ids)
+
+
+def run_point(owners, members, args):
+    member = seed(owners, members, args.events_per_owner)
+    client = APIClient()
+    client.force_authenticate(user=member)
+
+    legacy = measure(lambda: list(legacy_queryset(member)), repeat=args.repeat)
+    access = measure(lambda: list(access_queryset(member)), repeat=args.repeat)
+    endpoint = measure(lambda: client.get("/api/events/"), repeat=args.repeat)
+    return (
+        owners, members, len(access_queryset(member)),
+        f"{legacy['p50']:.2f}", f"{access['p50']:.2f}", f"{endpoint['p50']:.2f}",
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events-per-owner", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    with throwaway_database():
+        for owners, members in GRID:
+            with transaction.atomic():
+                rows.append(run_point(owners, members, args))
+                transaction.set_rollback(True)
+
+    print_table(
+        ["owners", "members", "rows", "legacy qs p50 ms", "access qs p50 ms", "/api/events/ p50 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Generated by 'django-admin startproject' using Django 6.0.1.
 """
 
 from pathlib import Path
+import copy
 import os
 import importlib.util
 from dotenv import load_dotenv
@@ -54,7 +55,9 @@ if importlib.util.find_spec('jwt') is not None:
     INSTALLED_APPS.append('allauth.socialaccount.providers.google')
 
 MIDDLEWARE = [
+    'api.middleware.QueryInstrumentationMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'api.middleware.DatabaseRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -89,13 +92,58 @@ WSGI_APPLICATION = 'config.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
-        'NAME': 'wedding_flow',
-        'USER': 'postgres',
-        'PASSWORD': 'postgres',
-        'HOST': 'localhost',
-        'PORT': '5433',
+        'NAME': os.getenv('POSTGRES_DB', 'wedding_flow'),
+        'USER': os.getenv('POSTGRES_USER', 'postgres'),
+        'PASSWORD': os.getenv('POSTGRES_PASSWORD', 'postgres'),
+        'HOST': os.getenv('POSTGRES_HOST', 'localhost'),
+        'PORT': os.getenv('POSTGRES_PORT', '5433'),
+        'OPTIONS': {
+            'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', '5')),
+        },
+    }
+}
+
+# Connection reuse, DB_CONN_MODE:
+# - "pool": a psycopg 3 connection pool per process (suits threaded/ASGI workers)
+# - "persistent": one connection per thread kept for DB_CONN_MAX_AGE seconds
+# - "none": connect on every request
+# Reused connections are health-checked before each request / checkout.
+DB_CONN_MODE = os.getenv('DB_CONN_MODE', 'persistent')
+if DB_CONN_MODE == 'pool':
+    # Django >= 5.1 checks each connection on checkout (ConnectionPool.check_connection)
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+        'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+        'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+        'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', '300')),
+        'max_lifetime': float(os.getenv('DB_POOL_MAX_LIFETIME', '3600')),
     }
+elif DB_CONN_MODE == 'persistent':
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.getenv('DB_CONN_MAX_AGE', '60'))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# Read replica (api.routers): list/retrieve and dashboard reads go to it once
+# POSTGRES_REPLICA_HOST is set. The alias always exists (defaulting to the
+# primary, connected lazily) so tests can mirror it.
+DATABASE_REPLICA_ALIAS = 'replica'
+DATABASE_REPLICA_ENABLED = bool(os.getenv('POSTGRES_REPLICA_HOST'))
+DATABASES[DATABASE_REPLICA_ALIAS] = {
+    **copy.deepcopy(DATABASES['default']),
+    'HOST': os.getenv('POSTGRES_REPLICA_HOST', DATABASES['default']['HOST']),
+    'PORT': os.getenv('POSTGRES_REPLICA_PORT', DATABASES['default']['PORT']),
+    'TEST': {'MIRROR': 'default'},
 }
+DATABASE_ROUTERS = ['api.routers.PrimaryReplicaRouter']
+# Seconds a user's reads stay on the primary after they write
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', '10'))
+
+# Per-request SQL instrumentation (api.middleware.QueryInstrumentationMiddleware):
+# Server-Timing header on every response, a warning with the slowest SQL for
+# requests over SLOW_REQUEST_MS, and opt-in logging of repeated query shapes (N+1)
+REQUEST_TIMING_ENABLED = os.getenv('REQUEST_TIMING_ENABLED', 'True') == 'True'
+SLOW_REQUEST_MS = int(os.getenv('SLOW_REQUEST_MS', '500'))
+QUERY_REPEAT_DETECTION = os.getenv('QUERY_REPEAT_DETECTION', 'False') == 'True'
+QUERY_REPEAT_THRESHOLD = int(os.getenv('QUERY_REPEAT_THRESHOLD', '5'))
 
 # CORS Settings
 CORS_ALLOW_ALL_ORIGINS = True # For development only
@@ -130,14 +178,50 @@ STATIC_URL = 'static/'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'api.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.KeysetPagination',
+    'PAGE_SIZE': 50,
 }
 
+# Compatibility switch: while False, list endpoints are only paginated when the
+# client sends ?cursor= or ?page_size=; when True every list response is paginated.
+API_PAGINATE_BY_DEFAULT = os.getenv('API_PAGINATE_BY_DEFAULT', 'False') == 'True'
+
+# Cache: per-process local memory by default; set REDIS_URL to share the
+# cache (and token invalidations) between workers.
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+
+# CachedTokenAuthentication: token -> user/profile entries, in seconds
+AUTH_TOKEN_CACHE_ALIAS = 'default'
+AUTH_TOKEN_CACHE_TTL = int(os.getenv('AUTH_TOKEN_CACHE_TTL', '300'))
+
 # Auth & Allauth Settings
 SITE_ID = 1
 
@@ -146,7 +230,25 @@ AUTHENTICATION_BACKENDS = [
     'allauth.account.auth_backends.AuthenticationBackend',
 ]
 
-EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+EMAIL_HOST = os.getenv('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.getenv('EMAIL_PORT', '25'))
+EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'False') == 'True'
+EMAIL_TIMEOUT = 30
+
+# Background jobs (api.jobs): outbound email is queued and sent by `manage.py run_workers`
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '2'))
+JOB_BATCH_SIZE = 20
+JOB_POLL_INTERVAL = float(os.getenv('JOB_POLL_INTERVAL', '2'))
+JOB_MAX_ATTEMPTS = 5
+JOB_RETRY_BASE_SECONDS = 30
+JOB_RETRY_MAX_SECONDS = 3600
+JOB_LEASE_SECONDS = 600
+
+# Threads used to hash generated passwords when onboarding a roster (/api/contacts/bulk/)
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '4'))
 
 ACCOUNT_AUTHENTICATION_METHOD = 'email'
 ACCOUNT_EMAIL_REQUIRED = True
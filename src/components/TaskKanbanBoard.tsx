@@ -2,8 +2,11 @@
 import { DragDropContext, Droppable, Draggable, type DropResult } from "react-beautiful-dnd";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
+import { Button } from "@/components/ui/button";
 import { format } from "date-fns";
 import { cn } from "@/lib/utils";
+import { api } from "@/lib/api";
+import { useAuth } from "@/hooks/useAuth";
 
 // Strict Mode fix for react-beautiful-dnd in React 18
 import { useEffect, useState } from "react";
@@ -16,6 +19,7 @@ interface Task {
     due_date?: string;
     assigned_to?: string;
     status: string;
+    position: number;
 }
 
 interface Column {
@@ -23,15 +27,28 @@ interface Column {
     title: string;
 }
 
-interface TaskKanbanBoardProps {
+interface BoardColumn {
     tasks: Task[];
+    count: number;
+    next: string | null;
+}
+
+interface TaskKanbanBoardProps {
+    projectId: string;
+    department: string;
     columns: Column[];
-    onStatusChange: (taskId: string, newStatus: string) => void;
     title: string;
+    // Changes whenever the page reloads its data, so the board refetches too
+    refreshKey?: number;
+    onTasksMoved?: () => void;
 }
 
-export function TaskKanbanBoard({ tasks, columns, onStatusChange, title }: TaskKanbanBoardProps) {
+const PAGE_SIZE = 50;
+
+export function TaskKanbanBoard({ projectId, department, columns, title, refreshKey, onTasksMoved }: TaskKanbanBoardProps) {
+    const { token } = useAuth();
     const [enabled, setEnabled] = useState(false);
+    const [board, setBoard] = useState<Record<string, BoardColumn>>({});
 
     useEffect(() => {
         const animation = requestAnimationFrame(() => setEnabled(true));
@@ -41,20 +58,76 @@ export function TaskKanbanBoard({ tasks, columns, onStatusChange, title }: TaskK
         };
     }, []);
 
-    const getTasksByStatus = (status: string) => {
-        return tasks.filter((task) => task.status === status);
+    const boardPath = (query: string) =>
+        `/tasks/board/?project_id=${projectId}&department=${department}&page_size=${PAGE_SIZE}&${query}`;
+
+    useEffect(() => {
+        if (!token) return;
+        // One request: every column's first page and total count
+        const statuses = columns.map((column) => column.id).join(",");
+        api.get(boardPath(`status=${statuses}`), token)
+            .then((data) => {
+                const loaded: Record<string, BoardColumn> = {};
+                for (const column of data.columns) {
+                    loaded[column.status] = { tasks: column.results, count: column.count, next: column.next };
+                }
+                setBoard(loaded);
+            })
+            .catch((error) => console.error("Failed to load task board", error));
+    }, [projectId, department, refreshKey, token]);
+
+    const loadMore = async (status: string) => {
+        const column = board[status];
+        if (!column?.next) return;
+        const cursor = new URL(column.next).searchParams.get("cursor");
+        try {
+            const data = await api.get(boardPath(`status=${status}&cursor=${cursor}`), token);
+            const page = data.columns[0];
+            setBoard((current) => ({
+                ...current,
+                [status]: { tasks: [...current[status].tasks, ...page.results], count: page.count, next: page.next },
+            }));
+        } catch (error) {
+            console.error("Failed to load more tasks", error);
+        }
     };
 
-    const onDragEnd = (result: DropResult) => {
-        if (!result.destination) return;
+    const getTasksByStatus = (status: string) => board[status]?.tasks || [];
+
+    const onDragEnd = async (result: DropResult) => {
+        const { source, destination } = result;
+        if (!destination) return;
+        if (source.droppableId === destination.droppableId && source.index === destination.index) return;
 
-        const { draggableId, destination } = result;
-        const newStatus = destination.droppableId;
+        const sourceTasks = [...getTasksByStatus(source.droppableId)];
+        const [task] = sourceTasks.splice(source.index, 1);
+        const sameColumn = source.droppableId === destination.droppableId;
+        const destinationTasks = sameColumn ? sourceTasks : [...getTasksByStatus(destination.droppableId)];
+        destinationTasks.splice(destination.index, 0, { ...task, status: destination.droppableId });
 
-        // Only call if status changed
-        const task = tasks.find(t => t.id === draggableId);
-        if (task && task.status !== newStatus) {
-            onStatusChange(draggableId, newStatus);
+        // Renumber the loaded cards of both columns and save them in one request
+        const renumber = (tasks: Task[]) => tasks.map((t, position) => ({ ...t, position }));
+        const changed: Record<string, Task[]> = { [destination.droppableId]: renumber(destinationTasks) };
+        if (!sameColumn) changed[source.droppableId] = renumber(sourceTasks);
+
+        const previous = board;
+        setBoard((current) => {
+            const next = { ...current };
+            for (const [status, tasks] of Object.entries(changed)) {
+                const delta = sameColumn ? 0 : status === destination.droppableId ? 1 : -1;
+                next[status] = { ...current[status], tasks, count: (current[status]?.count || 0) + delta };
+            }
+            return next;
+        });
+
+        const moves = Object.values(changed).flat()
+            .map((t) => ({ id: t.id, status: t.status, position: t.position }));
+        try {
+            await api.post("/tasks/move/", moves, token);
+            onTasksMoved?.();
+        } catch (error) {
+            console.error("Failed to move tasks", error);
+            setBoard(previous);
         }
     };
 
@@ -86,7 +159,7 @@ export function TaskKanbanBoard({ tasks, columns, onStatusChange, title }: TaskK
                                 <h4 className="font-semibold text-sm text-gray-700 flex justify-between items-center">
                                     {column.title}
                                     <Badge variant="secondary" className="text-xs">
-                                        {getTasksByStatus(column.id).length}
+                                        {board[column.id]?.count ?? 0}
                                     </Badge>
                                 </h4>
                             </div>
@@ -134,6 +207,11 @@ export function TaskKanbanBoard({ tasks, columns, onStatusChange, title }: TaskK
                                             </Draggable>
                                         ))}
                                         {provided.placeholder}
+                                        {board[column.id]?.next && (
+                                            <Button variant="ghost" size="sm" className="w-full" onClick={() => loadMore(column.id)}>
+                                                Load more
+                                            </Button>
+                                        )}
                                     </div>
                                 )}
                             </Droppable>
@@ -325,8 +325,10 @@ export default function ProjectDetails() {
             <CardContent>
               <TaskKanbanBoard
                 title="Video Production Tasks"
-                tasks={tasks.filter(t => t.department === 'video')}
-                onTaskUpdate={handleRefresh}
+                projectId={project.id}
+                department="video"
+                refreshKey={refreshKey}
+                onTasksMoved={handleRefresh}
                 columns={[
                   { id: 'backlog', title: 'Backlog' },
                   { id: 'in_progress', title: 'In Progress' },
@@ -335,14 +337,6 @@ export default function ProjectDetails() {
                   { id: 'correction', title: 'Correction' },
                   { id: 'submitted', title: 'Submitted' }
                 ]}
-                onStatusChange={async (taskId, newStatus) => {
-                  try {
-                    await api.patch(`/tasks/${taskId}/`, { status: newStatus }, token);
-                    handleRefresh();
-                  } catch (e) {
-                    console.error("Failed to update task status", e);
-                  }
-                }}
               />
             </CardContent>
           </Card>
@@ -355,8 +349,10 @@ export default function ProjectDetails() {
             <CardContent>
               <TaskKanbanBoard
                 title="Photo Production Tasks"
-                tasks={tasks.filter(t => t.department === 'photo')}
-                onTaskUpdate={handleRefresh}
+                projectId={project.id}
+                department="photo"
+                refreshKey={refreshKey}
+                onTasksMoved={handleRefresh}
                 columns={[
                   { id: 'backlog', title: 'Backlog' },
                   { id: 'client_review', title: 'Client Review' },
@@ -364,14 +360,6 @@ export default function ProjectDetails() {
                   { id: 'printing', title: 'Printing' },
                   { id: 'delivered', title: 'Delivered' }
                 ]}
-                onStatusChange={async (taskId, newStatus) => {
-                  try {
-                    await api.patch(`/tasks/${taskId}/`, { status: newStatus }, token);
-                    handleRefresh();
-                  } catch (e) {
-                    console.error("Failed to update task status", e);
-                  }
-                }}
               />
             </CardContent>
           </Card>
@@ -121,10 +121,10 @@ export default function TeamMemberDetails() {
 
       if (!memberData) return;
 
-      const tasksData = await api.get(`/tasks/?assigned_to=${memberData.name}`, token);
+      const tasksData = await api.get(`/tasks/?assignee_id=${memberData.id}`, token);
       setTasks(tasksData || []);
 
-      const eventsData = await api.get(`/events/?assigned_to=${memberData.name}`, token);
+      const eventsData = await api.get(`/events/?member_id=${memberData.id}`, token);
       setEvents(eventsData || []);
 
       const projectIds = new Set([